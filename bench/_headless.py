@@ -0,0 +1,26 @@
+"""
+Boots the engine and the game under CPython, using the `browser` stand-in in
+/headless instead of Brython's. Import this before anything from ursina.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'headless'), ROOT]
+
+
+def load_game():
+    """Import main.py (which boots CharadesApp and starts Ursina.run)."""
+    import main
+    return main
+
+
+def run_frame(dt=1000/60):
+    """Advance the virtual clock by dt ms and render one frame."""
+    from browser import timer
+    timer.run_animation_frame(dt)
+
+
+def run_frames(n, dt=1000/60):
+    for _ in range(n):
+        run_frame(dt)
@@ -0,0 +1,126 @@
+"""
+Compares what a cold load fetches for the game's own code: main.py, ursina.py
+and the ursina/*.py modules one by one, against the single app_bundle.js
+built by tools/build_app.py. Also checks that the bundle maps every module
+the game imports and that the stripped sources are the same code, minus the
+`if __name__ == '__main__':` demos.
+
+What the page fetches with the bundle is counted from index.html's scripts,
+the imports the bundles don't cover (Brython would fetch those from the
+server), and the loader's source check, which only runs on localhost.
+
+    python tools/build_app.py
+    python bench/bench_bundle.py
+"""
+import ast
+import gzip
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+
+from build_app import CHECK_HOSTS, OUT, BRYTHON
+from build_stdlib import OUT as STDLIB_OUT, imported_names, is_main_guard, load_vfs
+from sw_assets import served_files
+
+
+def load_bundle():
+    with open(os.path.join(ROOT, OUT), encoding='utf-8') as f:
+        text = f.read()
+    start = text.index('var bundle = ') + len('var bundle = ')
+    return text, json.loads(text[start:text.index('\n', start)])
+
+
+def fetched_from_source():
+    """Files Brython requests for the game's code without the bundle, in import order."""
+    files = ['main.py', 'ursina.py']
+    todo = list(files)
+    while todo:
+        with open(os.path.join(ROOT, todo.pop(0)), encoding='utf-8') as f:
+            names = imported_names(f.read(), in_functions=True)
+        for name in sorted(names):
+            parts = name.split('.')
+            if parts[0] != 'ursina':
+                continue
+            path = 'ursina/__init__.py' if len(parts) == 1 else 'ursina/' + parts[1] + '.py'
+            if os.path.exists(os.path.join(ROOT, path)) and path not in files:
+                files.append(path)
+                todo.append(path)
+    return files
+
+
+def page_scripts():
+    """The scripts index.html loads, in order."""
+    with open(os.path.join(ROOT, 'index.html'), encoding='utf-8') as f:
+        return re.findall(r'<script src="([^"]+)"', f.read())
+
+
+def fetched_imports(bundle):
+    """Modules the bundled code imports that neither bundle nor brython.js provides."""
+    with open(os.path.join(ROOT, BRYTHON), encoding='utf-8') as f:
+        builtins = json.loads(re.search(r'builtin_module_names=(\[[^]]*\])', f.read()).group(1))
+    known = set(bundle['modules']) | set(load_vfs(os.path.join(ROOT, STDLIB_OUT))) | set(builtins) | {'__main__'}
+    names = set()
+    for name, module in bundle['modules'].items():
+        names |= imported_names(module['source'], name, module['is_package'], in_functions=True)
+    # `from x import y` also lists x.y, which is only imported when x has no y
+    return sorted(n for n in names if n not in known and n.rpartition('.')[0] not in known)
+
+
+def without_demos(source):
+    tree = ast.parse(source)
+    tree.body = [node for node in tree.body if not is_main_guard(node)]
+    return ast.dump(tree)
+
+
+def size(data):
+    return len(data), len(gzip.compress(data, 6))
+
+
+def main():
+    text, bundle = load_bundle()
+    files = fetched_from_source()
+
+    paths = {('main' if path == 'main.py' else path[:-3].replace('/__init__', '').replace('/', '.')): path
+        for path in files if path != 'ursina.py'}
+    missing = set(paths) - set(bundle['modules'])
+    assert not missing, f'not in the bundle: {missing}'
+    assert bundle['modules']['ursina']['is_package']
+
+    stripped_bytes = 0
+    for name, module in bundle['modules'].items():
+        path = 'main.py' if name == 'main' else name.replace('.', '/') + ('/__init__.py' if module['is_package'] else '.py')
+        with open(os.path.join(ROOT, path), encoding='utf-8') as f:
+            source = f.read()
+        assert without_demos(module['source']) == without_demos(source), f'{name} changed when stripped'
+        assert not any(is_main_guard(node) for node in ast.parse(module['source']).body), name
+        stripped_bytes += len(module['source'].encode())
+
+    before = b''.join(open(os.path.join(ROOT, path), 'rb').read() for path in files)
+    raw, gz = size(before)
+    print(f'from source: {len(files)} requests, {raw / 1024:.1f} KiB ({gz / 1024:.1f} KiB gzipped)')
+    print('  ' + ' '.join(files))
+    scripts = page_scripts()
+    assert OUT in scripts, f"index.html doesn't load {OUT}"
+    fetched = fetched_imports(bundle)
+    assert not fetched, f'imported from the server despite the bundle: {fetched}'
+    precached = [path for path in files if './' + path in served_files()]
+    assert not precached, f"sw.js precaches sources the page doesn't load: {precached}"
+    raw, gz = size(text.encode())
+    print(f'{OUT}: 1 request, {raw / 1024:.1f} KiB ({gz / 1024:.1f} KiB gzipped), '
+          f'{len(bundle["modules"])} modules')
+    print(f'  page scripts: {len(scripts)} requests ({", ".join(scripts)}), no module fetched on import; '
+          f'the source check adds {len(bundle["sources"])} on {", ".join(CHECK_HOSTS)}')
+    print(f'  stripped sources {stripped_bytes / 1024:.1f} KiB of {len(before) / 1024:.1f} KiB, '
+          f'precompiled JS {"included" if bundle["implementation"] else "not built (no node)"}')
+    if bundle['implementation']:
+        sources_only = {name: {k: v for k, v in module.items() if k != 'js'} for name, module in bundle['modules'].items()}
+        raw, gz = size(json.dumps(sources_only).encode())
+        print(f'  without it: {raw / 1024:.1f} KiB ({gz / 1024:.1f} KiB gzipped)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+DOM operations per frame, counted by the headless `browser` stand-in:
+an idle menu, a screen change and a second of gameplay.
+
+    python bench/bench_dom_ops.py
+"""
+import _headless
+
+
+def frames_ops(n):
+    from browser import stats
+    start = len(stats.frames)
+    _headless.run_frames(n)
+    return stats.frames[start:]
+
+
+def main():
+    game = _headless.load_game()
+    from browser import stats
+
+    app = game.CharadesApp()
+    _headless.run_frames(2)
+
+    idle = frames_ops(60)
+    print(f'idle menu:     {sum(idle):5d} DOM ops over {len(idle)} frames')
+
+    before = stats.total
+    app.go(app.STATE_SETUP)
+    after_build = stats.total
+    first = frames_ops(1)
+    print(f'menu -> setup: {after_build - before:5d} DOM ops while building, {first[0]} in the next frame')
+
+    app.scores = [0 for _ in range(app.num_teams)]
+    app.go(app.STATE_GAMEPLAY)
+    app.on_word_action()
+    frames_ops(4 * 60)     # countdown + one second of the round
+    before = stats.total
+    play = frames_ops(60)
+    print(f'gameplay:      {stats.total - before:5d} DOM ops per second, {max(play)} in the busiest frame')
+    print('totals by kind:', dict(sorted(stats.counts.items())))
+
+
+if __name__ == '__main__':
+    main()
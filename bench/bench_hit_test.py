@@ -0,0 +1,107 @@
+"""
+Hover hit testing with 1000 overlapping buttons on screen: hit grid lookup vs.
+checking every collision entity (what a scan over scene.entities amounts to).
+The grid's hits, topmost first, are checked against what the headless DOM
+layout has under the same points (document.elementsFromPoint). Checks
+first that a tap on the menu unhovers its button again once the finger is
+lifted, and lets the main loop park.
+
+    python bench/bench_hit_test.py
+"""
+import random
+import time
+
+import _headless
+
+
+BUTTONS = 1000
+QUERIES = 5000
+CHECKED = 200   # queries compared with the DOM, elementsFromPoint walks every element
+MOVES = 100
+
+
+def check_touch():
+    from browser import document, Event, Touch, TouchList
+    from ursina import Button, application, mouse, scene
+    _headless.run_frames(5)
+    play = [e for e in scene.entities if isinstance(e, Button) and e.text_entity.b.innerHTML == 'Play'][0]
+    rect = play.b.getBoundingClientRect()
+
+    def touch(name):
+        t = Touch(0, rect.left + rect.width / 2, rect.top + rect.height / 2)
+        document.dispatch(name, Event(name, changedTouches=TouchList([t])))
+
+    touch('touchstart')
+    _headless.run_frames(mouse.update_rate + 1)
+    assert play.hovered and play in mouse.hovered_entities, 'touched button should be hovered'
+    touch('touchend')
+    _headless.run_frames(application.idle_after + mouse.update_rate + 1)
+    assert not play.hovered and not mouse.hovered_entities, 'lifting the finger should unhover the button'
+    assert not mouse._hover_pending and application.idle, 'main loop should park after the touch'
+    print('touch on Play hovered it, touchend unhovered it and the loop parked')
+
+
+def main():
+    _headless.load_game()
+    check_touch()
+    from browser import document
+    from ursina import Button, camera, window
+    from ursina.entity import hit_grid
+    from ursina.hit_grid import world_rect, is_shown
+
+    columns = 40
+    rows = BUTTONS // columns
+    buttons = list()
+    for i in range(BUTTONS):
+        b = Button(parent=camera.ui, text=str(i))
+        b.scale = (1.5 * .9 / columns, 1.5 * .9 / rows)  # overlapping their neighbours
+        b.x = -.45 + (i % columns + .5) * .9 / columns
+        b.y = .45 - (i // columns + .5) * .9 / rows
+        buttons.append(b)
+
+    t = time.perf_counter()
+    hit_grid.refresh()
+    build = time.perf_counter() - t
+
+    rng = random.Random(0)
+    points = [(rng.random(), rng.random()) for _ in range(QUERIES)]
+
+    t = time.perf_counter()
+    grid_hits = [hit_grid.hits_at(x, y) for x, y in points]
+    grid = time.perf_counter() - t
+
+    def scan(x, y):
+        hits = list()
+        for e in buttons:
+            x0, y0, x1, y1 = world_rect(e)
+            if x0 <= x <= x1 and y0 <= y <= y1 and is_shown(e):
+                hits.append(e)
+        return hits[::-1]
+
+    t = time.perf_counter()
+    scan_hits = [scan(x, y) for x, y in points]
+    brute = time.perf_counter() - t
+
+    _headless.run_frame()   # flush the styles
+    position, size = window.position, window.size
+    for (x, y), hits in list(zip(points, grid_hits))[:CHECKED]:
+        elements = document.elementsFromPoint(position[0] + x * size[0], position[1] + y * size[1])
+        dom = [e.entity for e in elements if getattr(e, 'entity', None) in hit_grid.order]
+        assert hits == dom, f'hit grid disagrees with the DOM at {x:.3f}, {y:.3f}: {hits} vs. {dom}'
+    assert sum(len(hits) > 1 for hits in grid_hits[:CHECKED]) > CHECKED // 4, 'too few overlapping hits to check the order'
+
+    t = time.perf_counter()
+    for b in rng.sample(buttons, MOVES):
+        b.x += .001
+    hit_grid.refresh()
+    moves = time.perf_counter() - t
+
+    print(f'{BUTTONS} buttons, {QUERIES} hover queries')
+    print(f'  index build:        {build*1000:8.2f} ms')
+    print(f'  hit grid:           {grid/QUERIES*1e6:8.2f} us/query')
+    print(f'  full scan:          {brute/QUERIES*1e6:8.2f} us/query')
+    print(f'  move {MOVES} buttons:    {moves*1000:8.2f} ms (incremental reindex)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Checks that `ursina` only imports what is used: `color` alone mustn't create
+the window, camera and scene. Then boots the game, checks that the modules
+that used to `from ursina import *` still find what they use (a Text
+background on and off), and prints ursina.lazy's report of which names
+pulled in which modules and how long each took.
+
+    python bench/bench_imports.py
+"""
+import sys
+
+import _headless
+
+
+def main():
+    import ursina
+    assert [m for m in sys.modules if m.startswith('ursina.')] == ['ursina.lazy'], 'importing ursina should be free'
+
+    from ursina import color
+    assert color.white
+    assert 'ursina.main' not in sys.modules and 'ursina.entity' not in sys.modules, 'color pulled in the engine'
+
+    from ursina import application
+    assert 'ursina.main' not in sys.modules
+
+    _headless.load_game()
+    from ursina import camera
+    from ursina.camera import Camera
+    assert isinstance(camera, Camera), 'ursina.camera should be the camera, not the module'
+    assert set(dir(ursina)) >= set(ursina.__all__)
+
+    # text.py and button.py import what they use themselves now
+    from ursina import Text, scene
+    t = Text('hi')
+    t.background = True
+    background = t.background
+    assert background in t.children
+    t.background = False
+    assert background not in t.children and background not in scene.entities, 'background should be destroyed'
+
+    from ursina import lazy
+    print(lazy.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Style changes that make the browser lay out again, with and without
+`Entity.animated` (transform based positioning), counted by the headless
+`browser` stand-in:
+
+- 30 seconds of a round, where the timer bar shrinks every second
+- a Tooltip following the mouse for 600 frames
+
+Also checks that both modes put the boxes in the same place.
+
+    python bench/bench_layout.py
+"""
+import _headless
+
+
+def same_rect(a, b):
+    return all(abs(getattr(a, k) - getattr(b, k)) < 1e-6 for k in ('left', 'top', 'width', 'height'))
+
+
+def render_counts(run):
+    from browser import stats
+    stats.render.clear()
+    run()
+    return dict(stats.render)
+
+
+def report(name, off, on):
+    print(f'{name}')
+    for label, counts in (('left/top/width/height', off), ('animated (transform)', on)):
+        print(f'  {label:22s} reflow {counts.get("reflow", 0):5d}   repaint {counts.get("repaint", 0):5d}   '
+              f'composite {counts.get("composite", 0):5d}')
+
+
+def round_timer(app, animated):
+    app.scores = [0 for _ in range(app.num_teams)]
+    app.go(app.STATE_GAMEPLAY)
+    app.timer_bar_fill.animated = animated
+    app.on_word_action()
+    _headless.run_frames(4 * 60)   # countdown
+    return render_counts(lambda: _headless.run_frames(30 * 60))
+
+
+def tooltip(animated):
+    from ursina import Tooltip, destroy, mouse
+    t = Tooltip('tooltip')
+    t.animated = animated
+    _headless.run_frame()
+
+    def follow_mouse():
+        for i in range(600):
+            mouse.position = ((i % 100) / 100 - .5, (i % 37) / 37 - .5)
+            _headless.run_frame()
+
+    counts = render_counts(follow_mouse)
+    destroy(t)
+    return counts
+
+
+def check_same_layout(app):
+    from ursina import Entity, Text, camera
+    app.scores = [0 for _ in range(app.num_teams)]
+    app.go(app.STATE_GAMEPLAY)
+    checked = 0
+    for ratio in (1, .75, .5, .1, 0):
+        app.time_left = app.round_duration * ratio
+        for animated in (False, True):
+            app.timer_bar_fill.animated = animated
+            _headless.run_frame()
+            app.update_timer_bar()
+            _headless.run_frame()
+            rect = app.timer_bar_fill.b.getBoundingClientRect()
+            if animated:
+                assert same_rect(rect, plain), (ratio, rect.__dict__, plain.__dict__)
+                checked += 1
+            plain = rect
+
+    parent = Entity(parent=camera.ui, scale=(.5, .4), x=.1)
+    for cls, kwargs in ((Entity, dict(scale=(.2, .1), origin=(-.5, .5))), (Text, dict(text='text'))):
+        e = cls(parent=parent, **kwargs)
+        for position in ((0, 0), (.3, -.2), (-.45, .1)):
+            e.animated = False
+            e.position = position
+            _headless.run_frame()
+            plain = e.b.getBoundingClientRect()
+            e.animated = True
+            _headless.run_frame()
+            assert same_rect(e.b.getBoundingClientRect(), plain), (cls.__name__, position)
+            checked += 1
+    print(f'same boxes in both modes: {checked} checks')
+
+
+def main():
+    game = _headless.load_game()
+    app = game.CharadesApp()
+    _headless.run_frames(2)
+
+    check_same_layout(app)
+    report('round timer, 30 s', round_timer(app, False), round_timer(app, True))
+    report('tooltip, 600 frames', tooltip(False), tooltip(True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Boots the game on top of the menu pre-rendered into index.html by
+tools/prerender_menu.py, like the page does: the elements are created first,
+then the entities adopt them. Checks that every pre-rendered element got
+adopted and that the result is the same DOM the pre-render was made from,
+which also fails when index.html is out of date. Runs once per viewport in
+prerender_menu.VIEWPORTS (each boot in a process of its own), and checks
+that a landscape phone gets no pre-render.
+
+    python tools/prerender_menu.py
+    python bench/bench_prerender.py
+"""
+import os
+import subprocess
+import sys
+
+import _headless
+
+sys.path.insert(0, os.path.join(_headless.ROOT, 'tools'))
+
+from prerender_menu import VIEWPORTS, build, pick, read_index, snapshot
+
+
+def count(nodes):
+    return sum(1 + count(n[7]) for n in nodes)
+
+
+def check(name):
+    from browser import document, stats
+    views = read_index()
+    assert views, 'nothing pre-rendered, run tools/prerender_menu.py'
+    assert pick(*VIEWPORTS[name]) == name
+    nodes = views[name]['nodes']
+    document.set_viewport(*VIEWPORTS[name])
+    game = document.getElementById('game')
+    build(nodes, game, document)
+    stats.reset()
+
+    from ursina import entity as entity_module
+    prerendered = len(entity_module._prerendered)
+    assert prerendered == count(nodes)
+    _headless.load_game()
+    assert not entity_module._prerendered, 'hydration should end with the first frame'
+
+    adopted = dict()
+    for e in game.querySelectorAll('[data-e]'):
+        adopted[id(e)] = (int(e.getAttribute('data-e')), e.getAttribute('data-c'))
+    assert len(adopted) == prerendered, f'{prerendered - len(adopted)} pre-rendered elements thrown away'
+    after = [snapshot(child, adopted) for child in game.children if child.id != 'loading_text']
+    assert after == nodes, 'the hydrated menu differs from index.html, run tools/prerender_menu.py'
+
+    created = entity_module._created
+    print(f'{name}: {prerendered} of {created} elements adopted from index.html, '
+          f'{stats.counts.get("create", 0)} created by the engine while booting')
+
+
+def main():
+    if len(sys.argv) > 1:
+        return check(sys.argv[1])
+    assert pick(667, 375) is None, 'landscape phones should keep "loading..."'
+    for name in VIEWPORTS:
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), name], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        print(result.stdout.splitlines()[-1])
+
+
+if __name__ == '__main__':
+    main()
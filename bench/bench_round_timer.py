@@ -0,0 +1,86 @@
+"""
+Round and countdown timers against the virtual clock of the headless
+`browser.timer`: on time, with throttled (late) ticks, with ticks dropped
+while the phone is locked, and across a pause. Each round has to end within
+one timer tick of its deadline, and the Scheduler may only ever keep one
+browser timer pending.
+
+    python bench/bench_round_timer.py
+"""
+import _headless
+
+
+def start_round(app, duration):
+    from browser import timer
+    app.round_duration = duration
+    app.scores = [0 for _ in range(app.num_teams)]
+    app.go(app.STATE_GAMEPLAY)
+    app.on_word_action()
+    return timer.now
+
+
+def run_until_round_ends(app, step=50, limit=10 * 60 * 1000):
+    from browser import timer
+    start = timer.now
+    while app.state == app.STATE_GAMEPLAY:
+        assert timer.now - start < limit, 'round never ended'
+        assert timer.pending() <= 1, f'{timer.pending()} browser timers pending'
+        timer.advance(step)
+    return timer.now
+
+
+def check(name, started, ended, expected, app):
+    from browser import timer
+    took = (ended - started) / 1000
+    late = took - expected
+    tick = max(app.TICK_SECONDS, timer.throttle / 1000) + .05
+    print(f'{name:34s} {took:7.2f} s (expected {expected:5.1f} s, {late:+.2f} s)')
+    assert 0 <= late <= tick, f'{name}: round ended {late:+.2f} s off its deadline'
+
+
+def main():
+    game = _headless.load_game()
+    from browser import timer
+
+    app = game.CharadesApp()
+    _headless.run_frames(2)
+    countdown = 3
+
+    started = start_round(app, 30)
+    check('on time', started, run_until_round_ends(app), countdown + 30, app)
+
+    timer.throttle = 1500
+    started = start_round(app, 30)
+    check('throttled to one tick per 1.5 s', started, run_until_round_ends(app), countdown + 30, app)
+    timer.throttle = 0
+
+    started = start_round(app, 30)
+    timer.advance(1000)                 # locked during the countdown
+    timer.advance(15 * 1000, drop=True) # and well into the round
+    timer.advance(300)
+    assert app.time_left == 17, app.time_left   # 30 - (16.3 - 3)
+    assert app.phase == app.PHASE_PLAYING, app.phase
+    check('ticks dropped for 15 s', started, run_until_round_ends(app), countdown + 30, app)
+
+    started = start_round(app, 30)
+    timer.advance(1500)
+    app.toggle_pause()                  # paused mid-countdown
+    assert app.countdown_value == 2, app.countdown_value
+    timer.advance(20 * 1000)
+    assert app.phase == app.PHASE_PAUSED and app.countdown_value == 2
+    app.toggle_pause()
+    timer.advance(10 * 1000 + 1500 + 600)
+    time_left = app.time_left
+    app.toggle_pause()                  # paused mid-round
+    timer.advance(30 * 1000)
+    assert app.time_left == time_left, (app.time_left, time_left)
+    app.toggle_pause()
+    check('paused 20 s + 30 s', started, run_until_round_ends(app), countdown + 30 + 50, app)
+
+    stats = app.scheduler.stats
+    print(f"scheduler: {stats['fired']} fired, {stats['cancelled']} cancelled, {stats['pending']} pending, "
+          f"max lateness {stats['max_lateness'] * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
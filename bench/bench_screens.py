@@ -0,0 +1,166 @@
+"""
+Screen build benchmark: drives CharadesApp.go() through every state and
+reports, per state, the wall time of go() plus the frame that flushes it
+(first and repeated visits), the entities constructed (pooled ones included),
+the DOM elements created and the DOM writes of a typical visit, and the peak
+Python memory of the build.
+
+    python bench/bench_screens.py --runs 50 --out bench_screens.json
+    python bench/bench_screens.py --baseline bench_screens.json
+
+Each measured go() starts from the menu screen, so the numbers include
+tearing the menu down.
+"""
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+
+import _headless
+
+
+DESKTOP = (1536, 864)
+MOBILE = (390, 844)     # iPhone 12-15 portrait
+
+DOM_WRITES = ('create', 'append', 'remove', 'style', 'css_text', 'class', 'html')
+
+
+def scenarios(app):
+    def with_scores(state):
+        def prepare():
+            app.scores = [i for i in range(app.num_teams)]
+            app.turn_index = 1
+        return state, prepare
+
+    # In the browser the setup screen always uses build_setup_mobile (the
+    # safe area is narrower than 1.15); build_setup_desktop is what desktop
+    # Ursina runs, so that one is measured with HAS_BRYTHON_TIMER off.
+    return [
+        ('menu',          DESKTOP, app.STATE_MENU, None, True),
+        ('setup_desktop', DESKTOP, app.STATE_SETUP, None, False),
+        ('setup_mobile',  MOBILE,  app.STATE_SETUP, None, True),
+        ('settings',      DESKTOP, app.STATE_SETTINGS, None, True),
+        ('howto',         DESKTOP, app.STATE_HOWTO, None, True),
+        ('gameplay',      DESKTOP) + with_scores(app.STATE_GAMEPLAY) + (True, ),
+        ('gameplay_mobile', MOBILE) + with_scores(app.STATE_GAMEPLAY) + (True, ),
+        ('summary',       DESKTOP) + with_scores(app.STATE_SUMMARY) + (True, ),
+        ('final',         DESKTOP) + with_scores(app.STATE_FINAL) + (True, ),
+    ]
+
+
+def count_entities():
+    """Wrap Entity.__init__ to count constructions, recycled pool entities included. Returns the counter."""
+    from ursina.entity import Entity
+    counter = dict(n=0)
+    init = Entity.__init__
+
+    def counting_init(self, *args, **kwargs):
+        counter['n'] += 1
+        init(self, *args, **kwargs)
+
+    Entity.__init__ = counting_init
+    return counter
+
+
+def measure(app, state, prepare, runs, entity_count):
+    from browser import stats
+
+    times, entities, created, writes = list(), list(), list(), list()
+    for _ in range(runs):
+        app.go(app.STATE_MENU)
+        _headless.run_frame()
+        if prepare:
+            prepare()
+
+        # Entity.__del__ removes its element, keep collections out of the numbers
+        gc.collect()
+        gc.disable()
+        counts = dict(stats.counts)
+        inits = entity_count['n']
+        t = time.perf_counter()
+        app.go(state)
+        _headless.run_frame()
+        times.append(time.perf_counter() - t)
+        gc.enable()
+
+        delta = {k: stats.counts.get(k, 0) - counts.get(k, 0) for k in DOM_WRITES}
+        entities.append(entity_count['n'] - inits)
+        created.append(delta['create'])
+        writes.append(sum(delta.values()))
+
+    # separate pass, tracemalloc slows everything down
+    app.go(app.STATE_MENU)
+    _headless.run_frame()
+    if prepare:
+        prepare()
+    tracemalloc.start()
+    app.go(state)
+    _headless.run_frame()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return dict(
+        ms_first=times[0] * 1000,
+        ms_median=statistics.median(times) * 1000,
+        ms_p95=sorted(times)[int(len(times) * .95) - 1 if len(times) > 1 else 0] * 1000,
+        entities=int(statistics.median(entities)),
+        elements=int(statistics.median(created)),
+        dom_writes=int(statistics.median(writes)),
+        peak_kb=peak / 1024,
+    )
+
+
+def compare(results, baseline):
+    print()
+    print(f'{"vs. baseline":16s}' + ''.join(f'{k:>12s}' for k in ('ms_median', 'entities', 'elements', 'dom_writes', 'peak_kb')))
+    for name, r in results.items():
+        b = baseline.get(name)
+        if not b:
+            continue
+        cells = list()
+        for k in ('ms_median', 'entities', 'elements', 'dom_writes', 'peak_kb'):
+            if k not in b:
+                cells.append(f'{"-":>12s}')
+                continue
+            change = (r[k] - b[k]) / b[k] * 100 if b[k] else 0
+            cells.append(f'{change:+11.1f}%')
+        print(f'{name:16s}' + ''.join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--out', help='write results as JSON')
+    parser.add_argument('--baseline', help='JSON from an earlier --out to compare against')
+    args = parser.parse_args()
+
+    game = _headless.load_game()
+    from browser import document
+
+    entity_count = count_entities()
+    app = game.CharadesApp()
+    results = dict()
+    for name, viewport, state, prepare, brython in scenarios(app):
+        document.set_viewport(*viewport)
+        game.HAS_BRYTHON_TIMER = brython
+        results[name] = measure(app, state, prepare, args.runs, entity_count)
+    document.set_viewport(*DESKTOP)
+    game.HAS_BRYTHON_TIMER = True
+
+    print(f'{"state":16s}{"ms first":>12s}{"ms median":>12s}{"ms p95":>12s}{"entities":>12s}{"elements":>12s}{"dom writes":>12s}{"peak KiB":>12s}')
+    for name, r in results.items():
+        print(f'{name:16s}{r["ms_first"]:12.2f}{r["ms_median"]:12.2f}{r["ms_p95"]:12.2f}{r["entities"]:12d}{r["elements"]:12d}{r["dom_writes"]:12d}{r["peak_kb"]:12.1f}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(results, json.load(f)['results'])
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(dict(runs=args.runs, results=results), f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
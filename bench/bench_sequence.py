@@ -0,0 +1,76 @@
+"""
+Checks that a started Sequence fires when driven by the main loop (and that
+the loop parks again once it's done), then times Sequence.update per frame
+for long scripted sequences. With the cursor over the delay-ordered funcs it
+shouldn't depend on the number of steps. The old full scan over
+Sequence.funcs is timed next to it.
+
+    python bench/bench_sequence.py
+"""
+import time     # ursina keeps the frame's dt in time.dt
+
+import _headless
+
+
+def noop():
+    pass
+
+
+def full_scan_update(seq):
+    # Sequence.update before the cursor: every Func, every frame
+    seq.t += time.dt
+    for f in seq.funcs:
+        if not f.finished and f.delay <= seq.t:
+            f()
+
+
+def per_frame_us(seq, update, frames):
+    seq.start()
+    seq.t = seq.duration / 2   # somewhere in the middle
+    seq._cursor = 0
+    update(seq)                # catch up on the first half
+    start = time.perf_counter()
+    for _ in range(frames):
+        update(seq)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def check_main_loop():
+    from ursina import application, Sequence, Wait, Func
+    fired = list()
+    seq = Sequence(Wait(.5), Func(fired.append, 'fired'))
+    assert seq in application.sequences and seq not in application.sequences.active
+
+    _headless.run_frames(application.idle_after + 5)
+    assert application.idle, 'main loop should park while nothing runs'
+    seq.start()
+    assert not application.idle, 'starting a sequence should wake the main loop'
+    _headless.run_frames(int(.5 * 60) + 2)
+    assert fired == ['fired'], fired
+    assert seq not in application.sequences, 'finished sequences remove themselves'
+    _headless.run_frames(application.idle_after + 1)
+    assert application.idle
+    print('started Sequence fired in the main loop')
+
+
+def main():
+    _headless.load_game()
+    from ursina.sequence import Sequence, Wait, Func
+    check_main_loop()
+
+    time.dt = 1 / 60
+    frames = 600
+    print(f'{"steps":>7s} {"cursor us/frame":>16s} {"full scan us/frame":>19s}')
+    for steps in (100, 1000, 10000):
+        args = list()
+        for _ in range(steps):
+            args += [Wait(.05), Func(noop)]
+        seq = Sequence(*args, auto_destroy=False)
+
+        cursor = per_frame_us(seq, Sequence.update, frames)
+        scan = per_frame_us(seq, full_scan_update, frames)
+        print(f'{steps:7d} {cursor:16.2f} {scan:19.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Tap latency for a category toggle on the setup screen: restyling the changed
+buttons in place vs. rebuilding the whole setup screen (the old behaviour).
+
+    python bench/bench_setup_tap.py
+"""
+import gc
+import statistics
+import time
+
+import _headless
+
+
+TAPS = 200
+
+
+def main():
+    game = _headless.load_game()
+    from browser import document, stats
+    from ursina import Button
+
+    # build_setup_desktop only runs outside the browser (desktop Ursina)
+    for name, viewport, brython in (('desktop', (1536, 864), False), ('mobile', (390, 844), True)):
+        document.set_viewport(*viewport)
+        game.HAS_BRYTHON_TIMER = brython
+        app = game.CharadesApp()
+        app.go(app.STATE_SETUP)
+        _headless.run_frame()
+
+        cats = list(app._active_word_bank().keys())
+        labels = {'Movies': 'Movies/TV', 'Objects': 'Everyday Objects', 'Jobs': 'Professions'}
+        buttons = dict()
+        for e in app.ui_root.children:
+            if isinstance(e, Button):
+                label = e.text_entity.b.innerHTML
+                if labels.get(label, label) in cats:
+                    buttons[labels.get(label, label)] = e
+
+        def measure(tap):
+            times, writes = list(), list()
+            for i in range(TAPS):
+                gc.collect()
+                gc.disable()
+                total = stats.total
+                t = time.perf_counter()
+                tap(cats[i % len(cats)])
+                _headless.run_frame()
+                times.append(time.perf_counter() - t)
+                writes.append(stats.total - total)
+                gc.enable()
+            return statistics.median(times) * 1000, statistics.median(writes)
+
+        def tap_in_place(name):
+            buttons[name].b.click()
+
+        def tap_rebuild(name):
+            # what toggle_cat used to do: change the selection, rebuild the screen
+            if not app.selected_categories:
+                app.selected_categories = {name}
+            elif name in app.selected_categories:
+                app.selected_categories.remove(name)
+            else:
+                app.selected_categories.add(name)
+            app._screens.clear()
+            app.go(app.STATE_SETUP)
+
+        app.selected_categories = set()
+        in_place = measure(tap_in_place)
+        app.selected_categories = set()
+        rebuild = measure(tap_rebuild)
+
+        print(f'build_setup_{name} ({viewport[0]}x{viewport[1]}), {TAPS} taps')
+        print(f'  rebuild screen:   {rebuild[0]:7.3f} ms/tap  {rebuild[1]:5.0f} DOM ops/tap')
+        print(f'  restyle in place: {in_place[0]:7.3f} ms/tap  {in_place[1]:5.0f} DOM ops/tap')
+
+    game.HAS_BRYTHON_TIMER = True
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Boots the game and checks the startup timeline from ursina/startup.py: every
+boot phase is there, nested where it runs, and the timeline ends up in
+localStorage once the first animation frame has run. Prints the timeline.
+Under CPython the times are only useful relative to each other; on a phone,
+read localStorage['ursina_startup'] (one JSON line per load) instead.
+
+    python bench/bench_startup.py
+"""
+import json
+
+import _headless
+
+
+PHASES = [
+    # (name, depth)
+    ('ursina import', 0),
+    ('Window()', 1),
+    ('Camera()', 1),
+    ('Mouse()', 1),
+    ('Ursina()', 0),
+    ('CharadesApp()', 0),
+    ('Layout()', 1),
+    ('word banks', 1),
+    ('go(STATE_MENU)', 1),
+    ('first frame', 0),
+    ('loading_text removed', 0),
+    ('first animation frame', 0),
+]
+
+
+def main():
+    _headless.load_game()
+    from ursina.startup import timeline
+    assert not timeline.finished, 'finished before the first animation frame'
+    _headless.run_frame()
+    assert timeline.finished
+
+    phases = [(p['name'], p['depth']) for p in timeline.phases]
+    assert phases == PHASES, phases
+    assert all(p['end'] >= p['start'] for p in timeline.phases)
+    starts = [p['start'] for p in timeline.phases]
+    assert starts == sorted(starts)
+
+    from browser import window
+    runs = [json.loads(line) for line in window.localStorage.getItem(timeline.storage_key).splitlines()]
+    assert len(runs) == 1 and [p['name'] for p in runs[0]['phases']] == [name for name, _ in PHASES]
+
+    print(timeline.report())
+
+
+if __name__ == '__main__':
+    main()
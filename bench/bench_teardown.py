@@ -0,0 +1,96 @@
+"""
+Regression benchmark for screen teardown: switching screens must not leave
+the old screen's entities behind in scene.entities or in the DOM. Also
+checks that leaving gameplay drops CharadesApp's references to its entities,
+which the pool hands to the next screen.
+
+    python bench/bench_teardown.py
+"""
+import time
+
+import _headless
+
+
+TRANSITIONS = 500
+
+
+def count_dom_nodes(element):
+    n = 0
+    stack = [element, ]
+    while stack:
+        e = stack.pop()
+        n += 1
+        stack.extend(e.children)
+    return n
+
+
+def check_stale_refs(app):
+    from browser import stats
+    app.scores = [0 for _ in range(app.num_teams)]
+    app.turn_index = 0
+    app.go(app.STATE_GAMEPLAY)
+    assert app.message_text is not None and app.timer_bar_fill is not None
+    app.go(app.STATE_SUMMARY)
+    stale = [name for name in app.UI_REFS if getattr(app, name) is not None]
+    assert not stale and not app.score_texts, f'still referenced after leaving gameplay: {stale}'
+
+    # late writes, like a queued flash or timer tick, mustn't reach the summary screen
+    _headless.run_frame()
+    total = stats.total
+    app.flash('Correct!', app.C_GOOD)
+    app._flash_revert()
+    app.update_timer_bar()
+    _headless.run_frame()
+    assert stats.total == total, 'a late write reached a recycled entity'
+    app.go(app.STATE_MENU)
+
+
+def main():
+    game = _headless.load_game()
+    from ursina import scene, camera
+
+    app = game.CharadesApp()
+    check_stale_refs(app)
+    states = [app.STATE_SETUP, app.STATE_SETTINGS, app.STATE_HOWTO, app.STATE_MENU]
+
+    def play_round():
+        app.scores = [0 for _ in range(app.num_teams)]
+        app.turn_index = 0
+        app.go(app.STATE_GAMEPLAY)
+
+    def toggle_language():
+        app.language = 'de' if app.language != 'de' else 'en'
+        app.go(app.STATE_SETTINGS)
+
+    # gameplay and summary are never cached; switching the language drops the cache
+    states += [play_round, app.STATE_SUMMARY, toggle_language, toggle_language, app.STATE_MENU]
+
+    # first round builds the cached screens
+    for state in states:
+        state() if callable(state) else app.go(state)
+    entities_before = len(scene.entities)
+    dom_before = count_dom_nodes(camera.ui.b)
+
+    # whole rounds only, so the same screens are cached at the end
+    transitions = -(-TRANSITIONS // len(states)) * len(states)
+
+    t = time.perf_counter()
+    for i in range(transitions):
+        state = states[i % len(states)]
+        state() if callable(state) else app.go(state)
+        _headless.run_frame()
+    elapsed = time.perf_counter() - t
+
+    entities_after = len(scene.entities)
+    dom_after = count_dom_nodes(camera.ui.b)
+
+    print(f'{transitions} screen transitions in {elapsed*1000:.1f} ms')
+    print(f'scene.entities: {entities_before} -> {entities_after}')
+    print(f'DOM nodes under camera.ui: {dom_before} -> {dom_after}')
+
+    assert entities_after == entities_before, 'entities leak across screen changes'
+    assert dom_after == dom_before, 'DOM nodes leak across screen changes'
+
+
+if __name__ == '__main__':
+    main()
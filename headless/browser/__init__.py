@@ -0,0 +1,434 @@
+"""
+Stand-in for Brython's `browser` module, so the engine and the game can be
+imported and driven under plain CPython (benchmarks, profiling, CI).
+
+Only the parts of the DOM API that ursina and main.py use are here. Layout is
+the simple absolute positioning ursina relies on: left/top/width/height in
+% or px relative to the parent, plus a translate() transform. Style values
+come from the inline style or from `.class {...}` rules in <style> elements.
+
+Every DOM operation is counted in `stats`, per frame and in total, so DOM
+traffic regressions show up without a browser. Style changes are also sorted
+into `stats.render` by whether they cause a reflow, a repaint or just compositing.
+"""
+
+
+class DomStats:
+    def __init__(self):
+        self.counts = dict()
+        self.frames = list()        # DOM operations per rendered frame
+        self.render = dict()        # style changes by the work they cause: reflow / repaint / composite
+        self._frame_start = 0
+
+    def count(self, kind):
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def begin_frame(self):
+        self._frame_start = self.total
+
+    def end_frame(self):
+        self.frames.append(self.total - self._frame_start)
+
+    def reset(self):
+        self.counts.clear()
+        self.frames.clear()
+        self.render.clear()
+        self._frame_start = 0
+
+stats = DomStats()
+
+
+
+# class name -> declarations, from every <style> element's innerHTML
+_class_rules = dict()
+
+def _parse_declarations(text, into):
+    for declaration in text.split(';'):
+        if ':' in declaration:
+            k, v = declaration.split(':', 1)
+            into[k.strip()] = v.strip()
+    return into
+
+def _add_stylesheet(text):
+    for block in text.split('}'):
+        if '{' not in block:
+            continue
+        selector, body = block.split('{', 1)
+        selector = selector.strip()
+        if selector.startswith('.') and ' ' not in selector:
+            _parse_declarations(body, _class_rules.setdefault(selector[1:], dict()))
+
+
+# Changing these moves or resizes boxes, so the browser has to lay out again.
+# transform and opacity only need compositing, everything else a repaint.
+_layout_props = ('left', 'top', 'right', 'bottom', 'width', 'height', 'font-size', 'padding',
+    'margin', 'border-width', 'white-space', 'display', 'position', 'direction', 'text-align')
+_composite_props = ('transform', 'transform-origin', 'opacity', 'will-change')
+
+def _render_cost(old, new):
+    changed = [k for k in set(old) | set(new) if old.get(k) != new.get(k)]
+    if not changed:
+        return None
+    if any(k in _layout_props for k in changed):
+        return 'reflow'
+    if all(k in _composite_props for k in changed):
+        return 'composite'
+    return 'repaint'
+
+
+def _kebab(name):
+    return ''.join('-' + c.lower() if c.isupper() else c for c in name)
+
+
+class Style:
+    def __init__(self):
+        object.__setattr__(self, '_props', dict())
+
+    def __getattr__(self, name):
+        if name == 'cssText':
+            return ''.join(f'{k}: {v}; ' for k, v in self._props.items()).strip()
+        return self._props.get(_kebab(name), '')
+
+    def __setattr__(self, name, value):
+        if name == 'cssText':
+            stats.count('css_text')
+            old = dict(self._props)
+            self._props.clear()
+            _parse_declarations(str(value), self._props)
+            self._count_render(old)
+            return
+
+        stats.count('style')
+        old = dict(self._props)
+        self._props[_kebab(name)] = str(value)
+        self._count_render(old)
+
+    def _count_render(self, old):
+        cost = _render_cost(old, self._props)
+        if cost:
+            stats.render[cost] = stats.render.get(cost, 0) + 1
+
+    def get(self, name, default=''):
+        return self._props.get(name, default)
+
+
+
+class Rect:
+    def __init__(self, left=0, top=0, width=0, height=0):
+        self.left = self.x = left
+        self.top = self.y = top
+        self.width = width
+        self.height = height
+        self.right = left + width
+        self.bottom = top + height
+
+    def contains(self, x, y):
+        return self.left <= x <= self.right and self.top <= y <= self.bottom
+
+
+def _length(value, reference, default=0):
+    value = value.strip()
+    try:
+        if value.endswith('%'):
+            return float(value[:-1]) / 100 * reference
+        if value.endswith('px'):
+            return float(value[:-2])
+        return float(value) if value else default
+    except ValueError:
+        return default
+
+
+def _translate(transform, w, h):
+    for name in ('translate3d(', 'translate('):
+        if name in transform:
+            args = transform.split(name, 1)[1].split(')', 1)[0].split(',')
+            return _length(args[0], w), _length(args[1], h) if len(args) > 1 else 0
+    return 0, 0
+
+
+def _scale(transform):
+    if 'scale(' in transform:
+        args = transform.split('scale(', 1)[1].split(')', 1)[0].split(',')
+        sx = float(args[0])
+        return sx, float(args[1]) if len(args) > 1 else sx
+    return 1, 1
+
+
+
+class Element:
+    def __init__(self, tag='div', id=''):
+        object.__setattr__(self, 'children', list())
+        self.tagName = tag.upper()
+        self.id = id
+        self.className = ''
+        self.style = Style()
+        self.parentNode = None
+        self.onclick = None
+        self._innerHTML = ''
+        self._attributes = dict()   # everything but id, class and style
+        self._listeners = dict()
+        self._rect = None   # fixed layout (the game element), otherwise computed
+
+    def __setattr__(self, name, value):
+        if name == 'innerHTML':
+            stats.count('html')
+            name = '_innerHTML'
+            for child in self.children:
+                child.parentNode = None
+            self.children.clear()
+            if self.tagName == 'STYLE':
+                _add_stylesheet(value)
+        elif name == 'className' and 'className' in self.__dict__:
+            stats.count('class')
+        object.__setattr__(self, name, value)
+
+    @property
+    def innerHTML(self):
+        return self._innerHTML
+
+    @property
+    def textContent(self):
+        return self._innerHTML
+
+    def appendChild(self, child):
+        stats.count('append')
+        if child.parentNode is not None:
+            child.parentNode.children.remove(child)
+        child.parentNode = self
+        self.children.append(child)
+        return child
+
+    def insertBefore(self, child, reference):
+        stats.count('append')
+        if child.parentNode is not None:
+            child.parentNode.children.remove(child)
+        child.parentNode = self
+        if reference is None:
+            self.children.append(child)
+        else:
+            self.children.insert(self.children.index(reference), child)
+        return child
+
+    def remove(self):
+        stats.count('remove')
+        if self.parentNode is not None:
+            self.parentNode.children.remove(self)
+            self.parentNode = None
+
+    def setAttribute(self, name, value):
+        if name == 'id':
+            self.id = value
+        elif name == 'class':
+            self.className = value
+        elif name == 'style':
+            self.style.cssText = value
+        else:
+            self._attributes[name] = str(value)
+
+    def getAttribute(self, name):
+        return self._attributes.get(name)
+
+    def querySelectorAll(self, selector):
+        """Only `[attribute]` selectors, in document order."""
+        assert selector.startswith('[') and selector.endswith(']'), selector
+        name = selector[1:-1]
+        found = list()
+        stack = list(reversed(self.children))
+        while stack:
+            e = stack.pop()
+            if name in e._attributes:
+                found.append(e)
+            stack.extend(reversed(e.children))
+        return found
+
+    def addEventListener(self, name, callback):
+        self._listeners.setdefault(name, list()).append(callback)
+
+    def dispatch(self, name, event=None):
+        """Fire `name` on this element like the browser would (listeners, then on<name>)."""
+        event = event if event is not None else Event(name, target=self)
+        for callback in self._listeners.get(name, ()):
+            callback(event)
+        handler = getattr(self, 'on' + name, None)
+        if handler:
+            handler(event)
+
+    def click(self):
+        self.dispatch('click')
+
+    def computed(self, name):
+        """Inline style value, else the one from the last matching class rule."""
+        value = self.style.get(name)
+        if value:
+            return value
+        classes = self.className.split()
+        for c, rule in _class_rules.items():
+            if c in classes and name in rule:
+                value = rule[name]
+        return value
+
+    def getBoundingClientRect(self):
+        stats.count('layout_read')
+        return self._layout()
+
+    def _layout(self):
+        if self._rect is not None:
+            return self._rect
+        if self.parentNode is None:
+            return Rect()
+
+        p = self.parentNode._layout()
+        get = self.computed
+        w = _length(get('width'), p.width)
+        h = _length(get('height'), p.height)
+        transform = get('transform')
+        tx, ty = _translate(transform, w, h)
+        sx, sy = _scale(transform)
+        # scale() works around the transform-origin, the box center by default
+        ox, oy = (0, 0) if get('transform-origin').startswith('0') else (w / 2, h / 2)
+        left = p.left + _length(get('left'), p.width) + tx + ox - ox * sx
+        top = p.top + _length(get('top'), p.height) + ty + oy - oy * sy
+        return Rect(left, top, w * sx, h * sy)
+
+    @property
+    def clientWidth(self):
+        return self._layout().width
+
+    @property
+    def clientHeight(self):
+        return self._layout().height
+
+
+
+class Event:
+    def __init__(self, type, **kwargs):
+        self.type = type
+        self.target = None
+        self.x = self.clientX = 0
+        self.y = self.clientY = 0
+        self.which = 1
+        self.key = ''
+        self.repeat = False
+        self.deltaY = 0
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        if 'x' in kwargs:
+            self.clientX = kwargs['x']
+        if 'y' in kwargs:
+            self.clientY = kwargs['y']
+
+
+class Touch:
+    def __init__(self, identifier, x, y):
+        self.identifier = identifier
+        self.clientX = x
+        self.clientY = y
+
+
+class TouchList:
+    def __init__(self, touches):
+        self._touches = list(touches)
+        self.length = len(self._touches)
+
+    def item(self, i):
+        return self._touches[i]
+
+
+
+class Document(Element):
+    def __init__(self):
+        super().__init__('#document')
+        self.head = self.appendChild(Element('head'))
+        self.body = self.appendChild(Element('body'))
+
+        game = self.body.appendChild(Element('div', id='game'))
+        game.className = 'game'
+        game.appendChild(Element('div', id='loading_text'))
+        stats.reset()
+        self.set_viewport(1536, 864)
+
+    def set_viewport(self, width, height):
+        """Resize the #game element (desktop default is 1536x864)."""
+        self.getElementById('game')._rect = Rect(0, 0, width, height)
+
+    def createElement(self, tag):
+        stats.count('create')
+        return Element(tag)
+
+    def getElementById(self, id):
+        stack = [self, ]
+        while stack:
+            e = stack.pop()
+            if e.id == id:
+                return e
+            stack.extend(e.children)
+        return None
+
+    def elementsFromPoint(self, x, y):
+        stats.count('layout_read')
+        hits = list()
+
+        def visit(e, pointer_events, visibility):
+            pe = e.computed('pointer-events') or 'auto'
+            if pe != 'auto':
+                pointer_events = pe
+            v = e.computed('visibility') or 'inherit'
+            if v != 'inherit':
+                visibility = v
+            if e.tagName not in ('#DOCUMENT', 'HEAD', 'BODY') and e._layout().contains(x, y):
+                if pointer_events != 'none' and visibility != 'hidden':
+                    hits.append(e)
+            for child in e.children:
+                visit(child, pointer_events, visibility)
+
+        # the game element is pointer-events: none in index.html
+        visit(self, 'auto', 'visible')
+        game = self.getElementById('game')
+        hits = [e for e in hits if e is not game]
+        return hits[::-1]
+
+
+class _LocalStorage:
+    def __init__(self):
+        self._items = dict()
+
+    def getItem(self, key):
+        return self._items.get(key)
+
+    def setItem(self, key, value):
+        self._items[key] = str(value)
+
+    def removeItem(self, key):
+        self._items.pop(key, None)
+
+
+class _Console:
+    def __init__(self):
+        self.messages = list()
+
+    def log(self, *args):
+        self.messages.append(' '.join(str(a) for a in args))
+
+
+class _Performance:
+    def now(self):
+        from browser import timer     # the virtual clock, in ms
+        return timer.now
+
+
+class _Window:
+    def __init__(self):
+        self.localStorage = _LocalStorage()
+        self.console = _Console()
+        self.performance = _Performance()
+        self.document = document
+
+
+document = Document()
+console = _Console()
+window = _Window()
+window.console = console
@@ -0,0 +1,101 @@
+"""
+Stand-in for `browser.timer`, driven by a virtual clock. Nothing runs on its
+own: call advance() / run_animation_frame() to move time forward.
+"""
+import heapq
+
+from browser import stats
+
+
+now = 0.0              # virtual time in ms, like performance.now()
+_next_handle = 1
+_queue = list()        # (due, handle) heap
+_timers = dict()       # handle -> [callback, interval ms or None, due]
+_animation_frames = list()
+throttle = 0           # ms: at most one timer callback per this many ms, like a background tab
+_last_fired = -1e18
+
+
+def _add(callback, ms, repeat):
+    global _next_handle
+    handle = _next_handle
+    _next_handle += 1
+    due = now + max(ms, 0)
+    _timers[handle] = [callback, ms if repeat else None, due]
+    heapq.heappush(_queue, (due, handle))
+    return handle
+
+
+def set_interval(callback, ms):
+    return _add(callback, ms, True)
+
+def set_timeout(callback, ms):
+    return _add(callback, ms, False)
+
+def clear_interval(handle):
+    _timers.pop(handle, None)
+
+def clear_timeout(handle):
+    _timers.pop(handle, None)
+
+
+def request_animation_frame(callback):
+    _animation_frames.append(callback)
+    return len(_animation_frames)
+
+
+def pending():
+    """Number of live timeouts/intervals."""
+    return len(_timers)
+
+
+def advance(ms, drop=False):
+    """
+    Move the virtual clock forward, firing due timers in order. With drop=True
+    it behaves like a locked phone: interval ticks that became due are
+    skipped, and timeouts only fire, late, once the clock reaches the end.
+    """
+    global now, _last_fired
+    end = now + ms
+    late = list()
+    while _queue and _queue[0][0] <= end:
+        due, handle = heapq.heappop(_queue)
+        timer = _timers.get(handle)
+        if timer is None or timer[2] != due:
+            continue
+
+        if throttle and due < _last_fired + throttle:
+            # throttled: runs late, and an interval counts on from when it ran
+            timer[2] = _last_fired + throttle
+            heapq.heappush(_queue, (timer[2], handle))
+            continue
+
+        now = max(now, due)
+        callback, interval, _ = timer
+        if interval is None:
+            del _timers[handle]
+        else:
+            timer[2] = due + max(interval, 1)
+            heapq.heappush(_queue, (timer[2], handle))
+
+        if not drop:
+            _last_fired = now
+            callback()
+        elif interval is None:
+            late.append(callback)
+    now = end
+    for callback in late:
+        _last_fired = now
+        callback()
+
+
+def run_animation_frame(dt=1000/60):
+    """Advance the clock by one frame and run the requested frame callbacks."""
+    advance(dt)
+    callbacks = _animation_frames[:]
+    _animation_frames.clear()
+    stats.begin_frame()
+    for callback in callbacks:
+        callback(now)
+    stats.end_frame()
+    return len(callbacks)
@@ -1,4 +1,31 @@
-from ursina import Ursina, Entity, Button, Text, camera, color, Sequence, window, mouse
+import heapq
+import math
+import time
+
+# Startup timeline (Ursina CSS): how long each boot phase took, see ursina/startup.py
+try:
+    from ursina.startup import timeline as startup
+except Exception:
+    startup = None
+
+
+class _NoPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def startup_phase(name):
+    """`with startup_phase(name):` times a boot phase when the startup timeline is there."""
+    if startup is None:
+        return _NoPhase()
+    return startup.phase(name)
+
+
+with startup_phase('ursina import'):
+    from ursina import Ursina, Entity, Button, Text, camera, color, Sequence, window, mouse, destroy
 
 # Sequence helpers (desktop Ursina)
 try:
@@ -10,6 +37,12 @@ except Exception:
         Wait = None
         Func = None
 
+# Entity pool (Ursina CSS): screens reuse the entities of destroyed screens
+try:
+    from ursina.pool import pool as entity_pool
+except Exception:
+    entity_pool = None
+
 # Brython timers (Ursina CSS / browser)
 HAS_BRYTHON_TIMER = False
 bry_timer = None
@@ -20,6 +53,27 @@ except Exception:
     HAS_BRYTHON_TIMER = False
     bry_timer = None
 
+# Browser window, for performance.now()
+try:
+    from browser import window as bry_window
+except Exception:
+    bry_window = None
+
+
+def monotonic():
+    """Seconds on a clock that only moves forward, for timer deadlines."""
+    if bry_window is not None:
+        try:
+            return bry_window.performance.now() / 1000.0
+        except Exception:
+            pass
+    return time.monotonic()
+
+
+def seconds_left(deadline):
+    """Whole seconds until deadline, rounded up like a countdown display."""
+    return max(0, int(math.ceil(deadline - monotonic() - 1e-6)))
+
 
 # -----------------------
 # Color helpers (Ursina CSS uses hsla strings)
@@ -85,6 +139,13 @@ def set_visible(obj, visible):
         pass
 
 
+def make(cls, *args, **kwargs):
+    """Create an entity, recycling a pooled one when the engine has a pool."""
+    if entity_pool is not None:
+        return entity_pool.acquire(cls, *args, **kwargs)
+    return cls(*args, **kwargs)
+
+
 def style_button(btn, bg, fg):
     """Force readable button colors in Ursina CSS."""
     if btn is None:
@@ -202,28 +263,19 @@ class Layout:
 # Scheduler: browser.timer in Brython, Sequence on desktop
 # -----------------------
 class _DesktopInterval:
+    # One looping Sequence for the whole lifetime of the interval, removed
+    # from application.sequences again on cancel().
     def __init__(self, callback, seconds):
         self.callback = callback
         self.seconds = seconds
         self.active = True
         self.seq = None
-        self._schedule_next()
-
-    def _schedule_next(self):
-        if not self.active:
-            return
-
-        def tick():
-            if not self.active:
-                return
-            self.callback()
-            self._schedule_next()
 
         try:
             if Wait is not None and Func is not None:
-                self.seq = Sequence(Wait(self.seconds), Func(tick))
+                self.seq = Sequence(Wait(self.seconds), Func(self._tick), loop=True)
             else:
-                self.seq = Sequence(self.seconds, tick)
+                self.seq = Sequence(self.seconds, self._tick, loop=True)
 
             if hasattr(self.seq, 'start'):
                 self.seq.start()
@@ -232,83 +284,144 @@ class _DesktopInterval:
         except Exception:
             self.active = False
 
+    def _tick(self):
+        if self.active:
+            self.callback()
+
     def cancel(self):
         self.active = False
-
-
-class _DesktopTimeout:
-    def __init__(self, callback, seconds):
-        self.active = True
-        self.callback = callback
-
-        def run():
-            if self.active:
-                self.callback()
-
+        if self.seq is None:
+            return
         try:
-            if Wait is not None and Func is not None:
-                self.seq = Sequence(Wait(seconds), Func(run))
-            else:
-                self.seq = Sequence(seconds, run)
-
-            if hasattr(self.seq, 'start'):
-                self.seq.start()
-            else:
-                self.seq()
+            self.seq.kill()
         except Exception:
-            self.active = False
+            pass
+        self.seq = None
 
-    def cancel(self):
-        self.active = False
+
+class _Timer:
+    def __init__(self, callback, due, interval):
+        self.callback = callback
+        self.due = due              # monotonic() seconds
+        self.interval = interval    # None for timeouts
+        self.active = True
 
 
 class Scheduler:
+    """
+    All of the app's timeouts and intervals in one heap, driven by a single
+    underlying timer: a browser timeout re-armed for the earliest due time, or
+    on desktop one Sequence interval while anything is pending.
+    """
+    DESKTOP_RESOLUTION = 1 / 20
+
     def __init__(self):
         self.backend = 'browser.timer' if HAS_BRYTHON_TIMER else 'Sequence'
+        self._queue = []        # (due, order, _Timer) heap, cancelled timers are dropped lazily
+        self._order = 0
+        self._armed = None      # handle of the underlying timer
+        self._armed_due = None
+        self.stats = dict(pending=0, fired=0, cancelled=0, max_lateness=0.0)
 
     def set_interval(self, callback, seconds):
-        if HAS_BRYTHON_TIMER:
-            try:
-                return bry_timer.set_interval(callback, int(seconds * 1000))
-            except Exception:
-                return None
-        return _DesktopInterval(callback, seconds)
+        return self._add(callback, seconds, seconds)
 
     def clear_interval(self, handle):
-        if handle is None:
-            return
-        if HAS_BRYTHON_TIMER:
-            try:
-                bry_timer.clear_interval(handle)
-            except Exception:
-                pass
-        else:
-            try:
-                handle.cancel()
-            except Exception:
-                pass
+        self.cancel(handle)
 
     def set_timeout(self, callback, seconds):
-        if HAS_BRYTHON_TIMER:
-            try:
-                return bry_timer.set_timeout(callback, int(seconds * 1000))
-            except Exception:
-                return None
-        return _DesktopTimeout(callback, seconds)
+        return self._add(callback, seconds, None)
 
     def clear_timeout(self, handle):
-        if handle is None:
+        self.cancel(handle)
+
+    def cancel(self, handle):
+        if handle is None or not handle.active:
             return
+        handle.active = False
+        self.stats['pending'] -= 1
+        self.stats['cancelled'] += 1
+
+    def _add(self, callback, seconds, interval):
+        t = _Timer(callback, monotonic() + seconds, interval)
+        self._push(t)
+        self.stats['pending'] += 1
+        if not self._arm():
+            self.cancel(t)
+            return None
+        return t
+
+    def _push(self, t):
+        self._order += 1
+        heapq.heappush(self._queue, (t.due, self._order, t))
+
+    def _arm(self):
+        # make sure the underlying timer goes off by the earliest due time
+        queue = self._queue
+        while queue and not queue[0][2].active:
+            heapq.heappop(queue)
+        if not queue:
+            self._disarm()
+            return True
+
+        due = queue[0][0]
+        if self._armed is not None and (self._armed_due is None or self._armed_due <= due):
+            return True
+
+        self._disarm()
+        try:
+            if HAS_BRYTHON_TIMER:
+                delay = max(0, int(math.ceil((due - monotonic()) * 1000)))
+                self._armed = bry_timer.set_timeout(self._run, delay)
+                self._armed_due = due
+            else:
+                self._armed = _DesktopInterval(self._run, self.DESKTOP_RESOLUTION)
+                self._armed_due = None  # polls, so it's never too late
+        except Exception:
+            self._armed = None
+            return False
+        return self._armed is not None
+
+    def _disarm(self):
+        if self._armed is None:
+            return
+        try:
+            if HAS_BRYTHON_TIMER:
+                bry_timer.clear_timeout(self._armed)
+            else:
+                self._armed.cancel()
+        except Exception:
+            pass
+        self._armed = None
+        self._armed_due = None
+
+    def _run(self):
         if HAS_BRYTHON_TIMER:
-            try:
-                bry_timer.clear_timeout(handle)
-            except Exception:
-                pass
-        else:
-            try:
-                handle.cancel()
-            except Exception:
-                pass
+            self._armed = None  # the browser timeout is used up
+            self._armed_due = None
+
+        now = monotonic()
+        queue = self._queue
+        try:
+            while queue and queue[0][0] <= now:
+                due, _, t = heapq.heappop(queue)
+                if not t.active:
+                    continue
+
+                self.stats['fired'] += 1
+                self.stats['max_lateness'] = max(self.stats['max_lateness'], now - due)
+                if t.interval is None:
+                    t.active = False
+                    self.stats['pending'] -= 1
+                else:
+                    # skip missed ticks instead of firing them all at once
+                    t.due = due + t.interval
+                    if t.due <= now:
+                        t.due = now + t.interval
+                    self._push(t)
+                t.callback()
+        finally:
+            self._arm()
 
 
 # -----------------------
@@ -381,14 +494,32 @@ class CharadesApp:
     STATE_SUMMARY = 'summary'
     STATE_FINAL = 'final'
 
+    # Screens that only depend on settings, kept built (hidden) between visits
+    CACHED_STATES = (STATE_MENU, STATE_SETUP, STATE_SETTINGS, STATE_HOWTO)
+
+    # Entities of the gameplay screen kept as attributes. Reset to None when
+    # the screen is destroyed: the pool hands the same objects to the next
+    # screen, so a late write through one would change that screen instead.
+    UI_REFS = (
+        'header_score_text', 'timer_text', 'timer_bar_bg', 'timer_bar_fill', 'word_text', 'message_text',
+        'countdown_text', 'btn_word_action', 'btn_correct', 'btn_pass', 'btn_end', 'btn_pause',
+        'score_panel', 'score_title', 'pause_overlay', 'pause_panel', 'pause_label', 'pause_btn_resume',
+        'pause_btn_menu',
+    )
+
     PHASE_REVEAL = 'reveal'
     PHASE_COUNTDOWN = 'countdown'
     PHASE_PLAYING = 'playing'
     PHASE_PAUSED = 'paused'
 
+    # Round and countdown timers keep an absolute deadline and only use the
+    # interval to check it, so throttled or dropped ticks can't stretch a round.
+    TICK_SECONDS = 0.25
+
     def __init__(self):
         self.scheduler = Scheduler()
-        self.layout = Layout()
+        with startup_phase('Layout()'):
+            self.layout = Layout()
 
         # Theme
         self.C_BG = hsv(230, 0.35, 0.12)
@@ -497,8 +628,9 @@ class CharadesApp:
         self.rounds_per_team = 3
 
         # Word bank
-        self.word_bank = self._make_word_bank()
-        self.word_bank_de = self._make_word_bank_de()
+        with startup_phase('word banks'):
+            self.word_bank = self._make_word_bank()
+            self.word_bank_de = self._make_word_bank_de()
 
         # Category filter:
         # empty set means "ALL categories"
@@ -524,41 +656,28 @@ class CharadesApp:
         self._countdown_interval = None
         self._flash_timeout = None
 
+        # Timer deadlines (monotonic() seconds), and the time left when paused
+        self._round_deadline = None
+        self._countdown_deadline = None
+        self._remaining_before_pause = None
+
         # UI roots
         self.root = None
         self.bg_root = None
         self.ui_root = None
 
-        # UI refs
-        self.header_score_text = None
-        self.timer_text = None
-        self.timer_bar_bg = None
-        self.timer_bar_fill = None
-        self.word_text = None
-        self.message_text = None
-        self.countdown_text = None
-
-        self.btn_word_action = None
-        self.btn_correct = None
-        self.btn_pass = None
-        self.btn_end = None
-        self.btn_pause = None
+        # Screen cache: (state, language, layout signature) -> (root, bg_root, ui_root, refresh)
+        self._screens = {}
+        self._screen_refresh = None
 
-        self.score_panel = None
-        self.score_title = None
-        self.score_texts = []
-        self.score_rows = []
-
-        self.pause_overlay = None
-        self.pause_panel = None
-        self.pause_label = None
-        self.pause_btn_resume = None
-        self.pause_btn_menu = None
+        # UI refs
+        self.forget_ui_refs()
 
         safe_setattr(window, 'title', 'Charades (2D)')
         safe_setattr(window, 'color', self.C_BG)
 
-        self.go(self.STATE_MENU)
+        with startup_phase('go(STATE_MENU)'):
+            self.go(self.STATE_MENU)
 
     def _tf(self):
         try:
@@ -720,27 +839,74 @@ class CharadesApp:
 
     # ---------- UI helpers ----------
     def clear(self):
-        if self.root is not None:
-            set_visible(self.root, False)
+        self.hide_current_screen()
 
-        self.root = Entity(parent=camera.ui)
+        self.root = make(Entity, parent=camera.ui)
 
         # Background layer (NOT scaled)
-        self.bg_root = Entity(parent=self.root)
+        self.bg_root = make(Entity, parent=self.root)
 
         # UI layer (scaled on mobile)
-        self.ui_root = Entity(parent=self.root)
+        self.ui_root = make(Entity, parent=self.root)
         try:
             s = getattr(self.layout, 'ui_scale', 1.0)
             safe_setattr(self.ui_root, 'scale', (s, s))
         except Exception:
             pass
 
+    def hide_current_screen(self):
+        if self.root is None:
+            return
+
+        # Cached screens are only hidden. Everything else is torn down
+        # completely; hiding it would leave every entity in scene.entities
+        # and the DOM for the rest of the session.
+        if self._is_cached(self.root):
+            set_visible(self.root, False)
+        else:
+            self.forget_ui_refs()
+            try:
+                destroy(self.root)
+            except Exception:
+                set_visible(self.root, False)
+        self.root = None
+
+    def forget_ui_refs(self):
+        for name in self.UI_REFS:
+            setattr(self, name, None)
+        self.score_texts = []
+        self.score_rows = []
+
+    def _is_cached(self, root):
+        for screen in self._screens.values():
+            if screen[0] is root:
+                return True
+        return False
+
+    def _layout_signature(self):
+        l = self.layout
+        try:
+            return (round(l.pw), round(l.ph))
+        except Exception:
+            return None
+
+    def _evict_stale_screens(self, language, signature):
+        """Drop cached screens built for another language or window size."""
+        for key in list(self._screens.keys()):
+            if key[1] == language and key[2] == signature:
+                continue
+            root = self._screens.pop(key)[0]
+            if root is not self.root:   # the current one is destroyed when it's hidden
+                try:
+                    destroy(root)
+                except Exception:
+                    set_visible(root, False)
+
     def quad(self, x, y, w, h, c, z=0.0, parent=None):
         if parent is None:
             parent = self.ui_root if self.ui_root is not None else self.root
 
-        e = Entity(parent=parent)
+        e = make(Entity, parent=parent)
         safe_setattr(e, 'model', 'quad')
         safe_setattr(e, 'x', x)
         safe_setattr(e, 'y', y)
@@ -754,7 +920,7 @@ class CharadesApp:
             parent = self.ui_root if self.ui_root is not None else self.root
 
         tf = self._tf()
-        t0 = Text(parent=parent, text=self._tr(t))
+        t0 = make(Text, parent=parent, text=self._tr(t))
         safe_setattr(t0, 'x', x)
         safe_setattr(t0, 'y', y)
         safe_setattr(t0, 'scale', s * tf)
@@ -766,7 +932,7 @@ class CharadesApp:
         if parent is None:
             parent = self.ui_root if self.ui_root is not None else self.root
 
-        b = Button(parent=parent, text=self._tr(label))
+        b = make(Button, parent=parent, text=self._tr(label))
         safe_setattr(b, 'model', 'quad')
         safe_setattr(b, 'x', x)
         safe_setattr(b, 'y', y)
@@ -804,6 +970,7 @@ class CharadesApp:
         self._round_interval = None
         self._countdown_interval = None
         self._flash_timeout = None
+        self._remaining_before_pause = None
 
     def start_countdown(self, n=3):
         self.scheduler.clear_interval(self._countdown_interval)
@@ -815,7 +982,8 @@ class CharadesApp:
         set_visible(self.countdown_text, True)
         self.countdown_text.text = str(self.countdown_value)
 
-        self._countdown_interval = self.scheduler.set_interval(self._countdown_tick, 1.0)
+        self._countdown_deadline = monotonic() + n
+        self._countdown_interval = self.scheduler.set_interval(self._countdown_tick, self.TICK_SECONDS)
         if self._countdown_interval is None:
             set_visible(self.countdown_text, False)
             self.begin_round()
@@ -824,21 +992,26 @@ class CharadesApp:
         if self.state != self.STATE_GAMEPLAY or self.phase != self.PHASE_COUNTDOWN or self.paused:
             return
 
-        self.countdown_value -= 1
+        value = seconds_left(self._countdown_deadline)
+        if value == self.countdown_value and value > 0:
+            return
+
+        self.countdown_value = value
         if self.countdown_value <= 0:
             self.scheduler.clear_interval(self._countdown_interval)
             self._countdown_interval = None
             set_visible(self.countdown_text, False)
-            self.begin_round()
+            self.begin_round(started=self._countdown_deadline)
             return
 
         self.countdown_text.text = str(self.countdown_value)
 
-    def start_round_timer(self):
+    def start_round_timer(self, started=None):
         self.scheduler.clear_interval(self._round_interval)
         self._round_interval = None
 
-        self._round_interval = self.scheduler.set_interval(self._timer_tick, 1.0)
+        self._round_deadline = (started if started is not None else monotonic()) + self.time_left
+        self._round_interval = self.scheduler.set_interval(self._timer_tick, self.TICK_SECONDS)
         if self._round_interval is None:
             self.message_text.text = self._tr("Timer backend failed — use End Round.")
             safe_setattr(self.message_text, 'color', self.C_WARN)
@@ -847,10 +1020,11 @@ class CharadesApp:
         if self.state != self.STATE_GAMEPLAY or self.phase != self.PHASE_PLAYING or self.paused:
             return
 
-        self.time_left -= 1
-        if self.time_left < 0:
-            self.time_left = 0
+        time_left = seconds_left(self._round_deadline)
+        if time_left == self.time_left and time_left > 0:
+            return
 
+        self.time_left = time_left
         if self.timer_text is not None:
             self.timer_text.text = f"{self.time_left}s"
         self.update_timer_bar()
@@ -880,7 +1054,25 @@ class CharadesApp:
 
         self.state = state
         self.layout = Layout()
+
+        signature = self._layout_signature()
+        self._evict_stale_screens(self.language, signature)
+        key = (state, self.language, signature)
+        screen = self._screens.get(key)
+        if screen is not None:
+            # re-show the cached screen and update its state-dependent labels
+            if screen[0] is not self.root:
+                self.hide_current_screen()
+                self.root, self.bg_root, self.ui_root, refresh = screen
+                set_visible(self.root, True)
+            else:
+                refresh = screen[3]
+            if refresh is not None:
+                refresh()
+            return
+
         self.clear()
+        self._screen_refresh = None
 
         if state == self.STATE_MENU:
             self.build_menu()
@@ -897,6 +1089,9 @@ class CharadesApp:
         elif state == self.STATE_FINAL:
             self.build_final()
 
+        if state in self.CACHED_STATES:
+            self._screens[key] = (self.root, self.bg_root, self.ui_root, self._screen_refresh)
+
     # ---------- Screens ----------
     def build_menu(self):
         l = self.layout
@@ -952,13 +1147,25 @@ class CharadesApp:
             self.auto_next_word = not self.auto_next_word
             self.go(self.STATE_SETTINGS)
 
-        self.btn(pass_label, 0, 0.06, toggle_pass, w=0.90, h=0.11,
-                 bg=self.C_WARN if self.pass_penalty else self.C_BTN_DARK,
-                 fg=BLACK if self.pass_penalty else WHITE)
+        pass_btn = self.btn(pass_label, 0, 0.06, toggle_pass, w=0.90, h=0.11,
+                            bg=self.C_WARN if self.pass_penalty else self.C_BTN_DARK,
+                            fg=BLACK if self.pass_penalty else WHITE)
+
+        auto_btn = self.btn(auto_label, 0, -0.08, toggle_auto, w=0.90, h=0.11,
+                            bg=self.C_PRIMARY if self.auto_next_word else self.C_BTN_DARK,
+                            fg=BLACK if self.auto_next_word else WHITE)
+
+        def refresh():
+            pass_btn.text = self._tr("Pass penalty: OFF (0)" if self.pass_penalty == 0 else "Pass penalty: ON (-1)")
+            style_button(pass_btn,
+                         self.C_WARN if self.pass_penalty else self.C_BTN_DARK,
+                         BLACK if self.pass_penalty else WHITE)
+            auto_btn.text = self._tr("Auto-next word: ON" if self.auto_next_word else "Auto-next word: OFF")
+            style_button(auto_btn,
+                         self.C_PRIMARY if self.auto_next_word else self.C_BTN_DARK,
+                         BLACK if self.auto_next_word else WHITE)
 
-        self.btn(auto_label, 0, -0.08, toggle_auto, w=0.90, h=0.11,
-                 bg=self.C_PRIMARY if self.auto_next_word else self.C_BTN_DARK,
-                 fg=BLACK if self.auto_next_word else WHITE)
+        self._screen_refresh = refresh
 
         self.btn("Back", 0, -0.28, lambda: self.go(self.STATE_MENU), bg=self.C_BTN_DARK, fg=WHITE)
 
@@ -1052,6 +1259,7 @@ class CharadesApp:
         x_right = l.right - btn_w / 2.0
 
         def toggle_cat(name):
+            before = [n for n in cat_buttons if self.category_on(n)]
             # empty selection means ALL categories are active
             if not self.selected_categories:
                 # first click turns on "filter mode" with only this category
@@ -1062,15 +1270,18 @@ class CharadesApp:
                     self.selected_categories.remove(name)
                 else:
                     self.selected_categories.add(name)
-            self.go(self.STATE_SETUP)
+            self.restyle_categories(cat_buttons, cat_colors, before)
 
+        cat_buttons = {}
         for i, name in enumerate(cats):
             x = x_left if (i % 2 == 0) else x_right
             y = start_y - (i // 2) * dy
             on = (not self.selected_categories) or (name in self.selected_categories)
             bg = cat_colors.get(name, self.C_PRIMARY) if on else self.C_BTN_DARK
             fg = BLACK if on else WHITE
-            self.btn(name, x, y, on_click=lambda n=name: toggle_cat(n), w=btn_w, h=0.065, bg=bg, fg=fg)
+            cat_buttons[name] = self.btn(name, x, y, on_click=lambda n=name: toggle_cat(n), w=btn_w, h=0.065, bg=bg, fg=fg)
+
+        self._screen_refresh = lambda: self.refresh_setup(t_val, d_val, r_val, cat_buttons, cat_colors)
 
         def start_game():
             active_bank = self._active_word_bank()
@@ -1177,8 +1388,10 @@ class CharadesApp:
 
         x0 = grid_left + b_w / 2
         x_cols = [x0 + i * (b_w + gap) for i in range(cols)]
+        cat_buttons = {}
 
         def toggle_cat(name):
+            before = [n for n in cat_buttons if self.category_on(n)]
             # empty selection means ALL categories are active
             if not self.selected_categories:
                 self.selected_categories = {name}
@@ -1187,7 +1400,7 @@ class CharadesApp:
                     self.selected_categories.remove(name)
                 else:
                     self.selected_categories.add(name)
-            self.go(self.STATE_SETUP)
+            self.restyle_categories(cat_buttons, cat_colors, before)
 
         for i, name in enumerate(cats):
             col = i % cols
@@ -1200,8 +1413,10 @@ class CharadesApp:
             fg = BLACK if on else WHITE
             label = disp.get(name, name)
 
-            self.btn(label, x, y, on_click=lambda n=name: toggle_cat(n),
-                     w=b_w, h=b_h, bg=bg, fg=fg, text_scale=0.85)
+            cat_buttons[name] = self.btn(label, x, y, on_click=lambda n=name: toggle_cat(n),
+                                         w=b_w, h=b_h, bg=bg, fg=fg, text_scale=0.85)
+
+        self._screen_refresh = lambda: self.refresh_setup(t_val, d_val, r_val, cat_buttons, cat_colors)
 
         def start_game():
             active_bank = self._active_word_bank()
@@ -1226,6 +1441,31 @@ class CharadesApp:
         self.btn("Start Game", 0, start_y_btn, start_game,
                  w=start_w, h=start_h, bg=self.C_PRIMARY, fg=BLACK, text_scale=0.95)
 
+    def refresh_setup(self, t_val, d_val, r_val, cat_buttons, cat_colors):
+        """Bring a (cached) setup screen up to date with the current settings."""
+        t_val.text = str(self.num_teams)
+        d_val.text = str(self.round_duration) + "s"
+        r_val.text = str(self.rounds_per_team)
+
+        for name, b in cat_buttons.items():
+            self.style_category(b, name, cat_colors)
+
+    def category_on(self, name):
+        # empty selection means ALL categories are active
+        return (not self.selected_categories) or (name in self.selected_categories)
+
+    def style_category(self, b, name, cat_colors):
+        on = self.category_on(name)
+        bg = cat_colors.get(name, self.C_PRIMARY) if on else self.C_BTN_DARK
+        fg = BLACK if on else WHITE
+        style_button(b, bg, fg)
+
+    def restyle_categories(self, cat_buttons, cat_colors, before):
+        """Restyle only the category buttons whose on/off state changed."""
+        for name, b in cat_buttons.items():
+            if self.category_on(name) != (name in before):
+                self.style_category(b, name, cat_colors)
+
     # ---------- Gameplay ----------
     def build_gameplay(self):
         self.stop_all_timers()
@@ -1294,6 +1534,7 @@ class CharadesApp:
 
         self.timer_bar_bg = self.quad(0, bar_y, bar_w, bar_h, hsv(0, 0, 0.25), z=0.04)
         self.timer_bar_fill = self.quad(0, bar_y, bar_w, bar_h, team_c, z=0.041)
+        safe_setattr(self.timer_bar_fill, 'animated', True)  # resized every second
 
         self.countdown_text = self.txt("", y=0.20, s=4.5, c=hsv(60, 0.60, 1.00))
         set_visible(self.countdown_text, False)
@@ -1451,7 +1692,7 @@ class CharadesApp:
             self.waiting_for_next = False
             set_visible(self.btn_word_action, False)
 
-    def begin_round(self):
+    def begin_round(self, started=None):
         self.phase = self.PHASE_PLAYING
         self.round_points = 0
         self.time_left = self.round_duration
@@ -1462,7 +1703,9 @@ class CharadesApp:
         set_visible(self.btn_pass, True)
         set_visible(self.btn_end, True)
 
-        self.start_round_timer()
+        self.start_round_timer(started)
+        if started is not None:
+            self._timer_tick()  # the countdown may have ended a while ago (throttled or locked phone)
 
     def on_correct(self):
         if self.state != self.STATE_GAMEPLAY or self.phase != self.PHASE_PLAYING or self.paused:
@@ -1514,6 +1757,13 @@ class CharadesApp:
             self.phase_before_pause = self.phase
             self.phase = self.PHASE_PAUSED
 
+            deadline = None
+            if self.phase_before_pause == self.PHASE_COUNTDOWN:
+                deadline = self._countdown_deadline
+            elif self.phase_before_pause == self.PHASE_PLAYING:
+                deadline = self._round_deadline
+            self._remaining_before_pause = deadline - monotonic() if deadline is not None else None
+
             self.scheduler.clear_interval(self._round_interval)
             self.scheduler.clear_interval(self._countdown_interval)
             self._round_interval = None
@@ -1527,10 +1777,13 @@ class CharadesApp:
 
         prev = self.phase_before_pause
         self.phase_before_pause = None
+        remaining = self._remaining_before_pause
+        self._remaining_before_pause = None
 
         if prev == self.PHASE_COUNTDOWN:
             self.phase = self.PHASE_COUNTDOWN
-            self._countdown_interval = self.scheduler.set_interval(self._countdown_tick, 1.0)
+            self._countdown_deadline = monotonic() + (remaining if remaining is not None else self.countdown_value)
+            self._countdown_interval = self.scheduler.set_interval(self._countdown_tick, self.TICK_SECONDS)
         elif prev == self.PHASE_PLAYING:
             self.phase = self.PHASE_PLAYING
             set_visible(self.btn_correct, True)
@@ -1538,7 +1791,8 @@ class CharadesApp:
             set_visible(self.btn_end, True)
             if self.waiting_for_next:
                 set_visible(self.btn_word_action, True)
-            self._round_interval = self.scheduler.set_interval(self._timer_tick, 1.0)
+            self._round_deadline = monotonic() + (remaining if remaining is not None else self.time_left)
+            self._round_interval = self.scheduler.set_interval(self._timer_tick, self.TICK_SECONDS)
         else:
             self.phase = prev if prev is not None else self.PHASE_REVEAL
 
@@ -1611,7 +1865,8 @@ class CharadesApp:
 # -----------------------
 def boot():
     try:
-        CharadesApp()
+        with startup_phase('CharadesApp()'):
+            CharadesApp()
     except Exception as e:
         root = Entity(parent=camera.ui)
         p = Entity(parent=root)
@@ -1622,7 +1877,8 @@ def boot():
 
 
 try:
-    app = Ursina()
+    with startup_phase('Ursina()'):
+        app = Ursina()
 except Exception:
     app = None
 
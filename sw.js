@@ -1,25 +1,16 @@
-const CACHE_NAME = "ursina-charades-v27";
+const CACHE_NAME = "ursina-charades-v41";
 
 // ASSET_LIST_START
 const ASSETS = [
   "./",
   "./README.md",
+  "./app_bundle.js",
   "./brython.js",
+  "./brython_modules.js",
   "./brython_stdlib.js",
   "./index.html",
-  "./main.py",
   "./manifest.json",
-  "./sw.js",
-  "./ursina/__init__.py",
-  "./ursina/button.py",
-  "./ursina/camera.py",
-  "./ursina/color.py",
-  "./ursina/entity.py",
-  "./ursina/input_handler.py",
-  "./ursina/main.py",
-  "./ursina/sequence.py",
-  "./ursina/text.py",
-  "./ursina.py"
+  "./sw.js"
 ];
 // ASSET_LIST_END
 
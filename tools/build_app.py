@@ -0,0 +1,232 @@
+"""
+Builds app_bundle.js: main.py and the ursina package in one file, so the
+browser fetches one script instead of main.py, ursina.py and every
+ursina/*.py module.
+
+    python tools/build_app.py
+
+The modules are registered in Brython's VFS under their module names, which
+is what maps `from ursina.main import ...` to the right source. The sources
+are stored without comments, blank lines and `if __name__ == '__main__':`
+demos. When node is available they are also transpiled to JavaScript ahead
+of time by the page's own brython.js, so a cold load doesn't have to
+transpile them either. That part is only used with the same brython.js.
+
+index.html runs main from the bundle when it's there, and main.py from
+source when the bundle is missing or stale. Staleness is checked after
+startup by hashing the served sources against the ones the bundle was built
+from, only when the page is served from this machine (CHECK_HOSTS): that
+fetches every source file, the requests the bundle is there to save. When
+they differ, the next load uses the sources until the bundle is rebuilt.
+
+Also updates the ASSETS list in sw.js.
+"""
+import ast
+import glob
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tokenize
+
+from build_stdlib import is_main_guard
+from sw_assets import ROOT, update_sw_assets
+
+OUT = 'app_bundle.js'
+BRYTHON = 'brython.js'
+CHECK_HOSTS = ['localhost', '127.0.0.1', '[::1]']     # where the sources are checked against the bundle
+
+
+def app_modules():
+    """(module name, path, is_package), main first."""
+    modules = [('main', 'main.py', False), ('ursina', 'ursina/__init__.py', True)]
+    for path in sorted(glob.glob(os.path.join(ROOT, 'ursina', '*.py'))):
+        name = os.path.basename(path)[:-3]
+        if name != '__init__':
+            modules.append(('ursina.' + name, 'ursina/' + name + '.py', False))
+    return modules
+
+
+def source_hash(path):
+    """32 bit FNV-1a over UTF-16 code units, like the check in the bundle does it on fetched text."""
+    with open(os.path.join(ROOT, path), encoding='utf-8', newline='') as f:
+        text = f.read().encode('utf-16-le')
+    h = 0x811c9dc5
+    for i in range(0, len(text), 2):
+        h ^= text[i] | (text[i + 1] << 8)
+        h = (h * 0x01000193) & 0xffffffff
+    return h
+
+
+def strip_source(source):
+    """source without comments, blank lines and `if __name__ == '__main__':` blocks. Docstrings stay."""
+    lines = source.splitlines()
+    drop = set()
+    for node in ast.parse(source).body:
+        if is_main_guard(node):
+            drop.update(range(node.lineno, node.end_lineno + 1))
+
+    # rows inside multi-line strings keep their blank lines
+    in_string = set()
+    fstrings = []
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        if tok.type == tokenize.COMMENT:
+            row, col = tok.start
+            lines[row - 1] = lines[row - 1][:col].rstrip()
+        elif tok.type == tokenize.STRING:
+            in_string.update(range(tok.start[0] + 1, tok.end[0] + 1))
+        elif tok.type == getattr(tokenize, 'FSTRING_START', None):
+            fstrings.append(tok.start[0])
+        elif tok.type == getattr(tokenize, 'FSTRING_END', None):
+            in_string.update(range(fstrings.pop() + 1, tok.end[0] + 1))
+
+    kept = [line for i, line in enumerate(lines, 1)
+        if i not in drop and (line.strip() or i in in_string)]
+    return '\n'.join(kept) + '\n'
+
+
+def bundle_id(sources, implementation):
+    h = 0x811c9dc5
+    for c in json.dumps([implementation, sorted(sources.items())]).encode():
+        h ^= c
+        h = (h * 0x01000193) & 0xffffffff
+    return '%08x' % h
+
+
+def run_node(request):
+    result = subprocess.run(['node', os.path.join(ROOT, 'tools', 'compile_brython.js')],
+        input=json.dumps(dict(request, brython=os.path.join(ROOT, BRYTHON))), capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def compile_modules(modules):
+    """Transpile with node, or None without it."""
+    if shutil.which('node') is None:
+        return None
+    return run_node(dict(modules=[dict(name=n, path=os.path.join(ROOT, p), is_package=pkg) for n, p, pkg in modules]))
+
+
+def parse_ms(scripts):
+    """{name: ms node takes to parse the JS in scripts[name]}."""
+    return run_node(dict(modules=[], parse=scripts))['parse_ms']
+
+
+LOADER = '''// Generated by tools/build_app.py, don't edit. Run it again after changing main.py or ursina/.
+(function($B){
+    var bundle = %(bundle)s
+
+    try{
+        if(localStorage.getItem("app_bundle_stale") == bundle.id){return}
+    }catch(err){}
+
+    // the transpiled code only works with the brython.js it was made with.
+    // Without it, the sources are transpiled on import; Brython then caches
+    // the result in indexedDB under the $timestamp.
+    var precompiled = String($B.implementation) == bundle.implementation,
+        scripts = {$timestamp: bundle.id}
+    for(var name in bundle.modules){
+        var module = bundle.modules[name]
+        if(precompiled){
+            scripts[name] = module.is_package ? [".py", "", [], 1] : [".py", "", []]
+            $B.precompiled[name] = module.is_package ? [module.js] : module.js
+            $B.lambda_magic = bundle.lambda_magic
+        }else if(name != "main"){
+            scripts[name] = module.is_package ? [".py", module.source, [], 1] : [".py", module.source, []]
+        }
+    }
+    $B.use_VFS = true
+    $B.update_VFS(scripts)
+
+    // what index.html puts in the main script. Brython transpiles VFS sources
+    // the main script imports once more before running it, so main's own
+    // source goes in the script itself.
+    $B.app_bundle = {
+        id: bundle.id,
+        main: precompiled ? "import main" : bundle.modules.main.source
+    }
+
+    function hash(text){
+        var h = 0x811c9dc5
+        for(var i = 0; i < text.length; i++){
+            h ^= text.charCodeAt(i)
+            h = Math.imul(h, 0x01000193) >>> 0
+        }
+        return h
+    }
+
+    // once the game runs, compare the sources with the ones the bundle was
+    // built from, and fall back to them on the next load if they changed.
+    // Only while developing, it fetches every one of them.
+    if(%(check_hosts)s.indexOf(location.hostname) == -1){return}
+    window.addEventListener("load", function(){
+        setTimeout(function(){
+            var paths = Object.keys(bundle.sources)
+            Promise.all(paths.map(function(path){
+                return fetch(path).then(function(r){return r.ok ? r.text() : null})
+            })).then(function(texts){
+                var stale = paths.filter(function(path, i){
+                    return texts[i] !== null && hash(texts[i]) != bundle.sources[path]
+                })
+                if(stale.length){
+                    console.warn("%(out)s is out of date (" + stale.join(", ") +
+                        "), the next load runs from source. Rebuild it with tools/build_app.py")
+                    localStorage.setItem("app_bundle_stale", bundle.id)
+                }
+            }).catch(function(){})
+        }, 3000)
+    })
+})(__BRYTHON__)
+'''
+
+
+def main():
+    modules = app_modules()
+    result = compile_modules(modules) or dict(implementation=None, lambda_magic=None, modules={}, ms={})
+    sources = {path: source_hash(path) for _, path, _ in modules}
+    bundled = dict()
+    for name, path, is_package in modules:
+        with open(os.path.join(ROOT, path), encoding='utf-8') as f:
+            bundled[name] = dict(is_package=is_package, source=strip_source(f.read()))
+        if name in result['modules']:
+            bundled[name]['js'] = result['modules'][name]
+    bundle = dict(
+        id=bundle_id(sources, result['implementation']),
+        implementation=result['implementation'],
+        lambda_magic=result['lambda_magic'],
+        sources=sources,
+        modules=bundled,
+    )
+    text = LOADER % dict(bundle=json.dumps(bundle), out=OUT, check_hosts=json.dumps(CHECK_HOSTS))
+
+    out = os.path.join(ROOT, OUT)
+    old = None
+    if os.path.exists(out):
+        with open(out, encoding='utf-8') as f:
+            old = f.read()
+    if text != old:
+        with open(out, 'w', encoding='utf-8') as f:
+            f.write(text)
+    update_sw_assets(bump=text != old)
+
+    source_size = sum(os.path.getsize(os.path.join(ROOT, p)) for _, p, _ in modules)
+    print(f'{OUT}: {len(modules)} modules, {len(text.encode()) / 1024:.0f} KiB '
+          f'(sources {source_size / 1024:.0f} KiB)')
+    if result['ms']:
+        # the transpiled JS is compiled on import either way, but the bundle
+        # itself is a bigger script to parse than with the sources only
+        sources_only = dict(bundle, modules={name: dict(m, js=None) for name, m in bundled.items()})
+        parsed = parse_ms(dict(bundle=text, sources=LOADER % dict(bundle=json.dumps(sources_only), out=OUT,
+            check_hosts=json.dumps(CHECK_HOSTS))))
+        transpile = sum(result['ms'].values())
+        extra = parsed['bundle'] - parsed['sources']
+        print(f'transpiling in the browser skipped: {transpile:.0f} ms here, main.py alone {result["ms"]["main"]:.0f} ms')
+        print(f'parsing {OUT}: {parsed["bundle"]:.1f} ms here, {parsed["sources"]:.1f} ms without the JS, '
+              f'so {transpile - extra:.0f} ms saved (download not included)')
+    else:
+        print('node not found, bundled the sources only')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
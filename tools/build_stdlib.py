@@ -0,0 +1,181 @@
+"""
+Builds brython_modules.js: the part of brython_stdlib.js the game imports.
+
+Imports are walked statically, starting from main.py, ursina.py and
+ursina/*.py and following the stdlib modules' own module level imports.
+Imports inside functions and under `if __name__ == '__main__'` aren't
+followed. For anything missed, the bundle falls back to loading the full
+brython_stdlib.js the first time such a module is imported.
+
+    python tools/build_stdlib.py
+
+Also updates the ASSETS list in sw.js. Run it again after adding imports.
+"""
+import ast
+import glob
+import json
+import os
+import sys
+
+from sw_assets import ROOT, update_sw_assets
+
+FULL = 'brython_stdlib.js'
+OUT = 'brython_modules.js'
+APP_SOURCES = ['main.py', 'ursina.py', 'ursina/*.py']
+
+
+def load_vfs(path):
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    start = source.index('var scripts = ') + len('var scripts = ')
+    end = source.rindex('__BRYTHON__.update_VFS')
+    return json.loads(source[start:end].strip().rstrip(';'))
+
+
+def is_main_guard(node):
+    test = getattr(node, 'test', None)
+    return (isinstance(node, ast.If) and isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name) and test.left.id == '__name__')
+
+
+def imported_names(source, module='', is_package=False, in_functions=False):
+    """Absolute module names imported by source, including `from x import submodule` candidates."""
+    names = set()
+
+    def visit(node):
+        for child in ast.iter_child_nodes(node):
+            if is_main_guard(child):
+                continue
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)) and not in_functions:
+                continue
+            if isinstance(child, ast.Import):
+                names.update(alias.name for alias in child.names)
+            elif isinstance(child, ast.ImportFrom):
+                base = child.module or ''
+                if child.level:
+                    package = module if is_package else module.rpartition('.')[0]
+                    for _ in range(child.level - 1):
+                        package = package.rpartition('.')[0]
+                    base = f'{package}.{base}'.strip('.')
+                names.add(base)
+                names.update(f'{base}.{alias.name}' for alias in child.names)
+            visit(child)
+
+    visit(ast.parse(source))
+    return names
+
+
+def app_imports():
+    names = set()
+    for pattern in APP_SOURCES:
+        for path in glob.glob(os.path.join(ROOT, pattern)):
+            with open(path, encoding='utf-8') as f:
+                names |= imported_names(f.read(), in_functions=True)
+    return names
+
+
+def closure(vfs, roots):
+    """roots plus everything they import, restricted to modules in the VFS."""
+    found = set()
+    todo = list(roots)
+    while todo:
+        name = todo.pop()
+        if name in found or name not in vfs:
+            continue
+        found.add(name)
+
+        # parent packages are imported first
+        parent = name.rpartition('.')[0]
+        if parent:
+            todo.append(parent)
+
+        entry = vfs[name]
+        ext, source = entry[0], entry[1]
+        if ext == '.py':
+            try:
+                todo.extend(imported_names(source, name, len(entry) > 3 and bool(entry[3])))
+            except SyntaxError:
+                todo.extend(entry[2] if len(entry) > 2 else ())
+        else:
+            todo.extend(entry[2] if len(entry) > 2 else ())
+    return found
+
+
+FALLBACK = '''
+// Modules the build didn't see coming: load the whole stdlib the first time
+// one of them is imported.
+(function($B){
+    var left_out = new Set(%(left_out)s),
+        vfs = $B.VFS,
+        loaded = false
+
+    function load_full_stdlib(){
+        loaded = true
+        console.warn("%(out)s: loading the full %(full)s")
+        var request = new XMLHttpRequest()
+        request.open("GET", "%(full)s", false)
+        request.send()
+        if(request.status != 200){return}
+        var update = $B.update_VFS
+        $B.update_VFS = function(scripts){
+            for(var name in scripts){
+                if(vfs.hasOwnProperty(name)){delete scripts[name]}
+            }
+            update(scripts)
+        }
+        try{
+            new Function(request.responseText)()
+        }finally{
+            $B.update_VFS = update
+        }
+    }
+
+    function check(name){
+        if(!loaded && typeof name == "string" && left_out.has(name)){
+            load_full_stdlib()
+        }
+    }
+
+    $B.VFS = new Proxy(vfs, {
+        get: function(target, name){check(name); return target[name]},
+        has: function(target, name){check(name); return name in target},
+        getOwnPropertyDescriptor: function(target, name){
+            check(name)
+            return Object.getOwnPropertyDescriptor(target, name)
+        }
+    })
+})(__BRYTHON__)
+'''
+
+
+def main():
+    vfs = load_vfs(os.path.join(ROOT, FULL))
+    timestamp = vfs.pop('$timestamp', None)
+
+    modules = closure(vfs, app_imports())
+    scripts = {'$timestamp': timestamp}
+    scripts.update((name, vfs[name]) for name in sorted(modules))
+    left_out = sorted(set(vfs) - modules)
+
+    bundle = ('__BRYTHON__.use_VFS = true;\nvar scripts = ' + json.dumps(scripts) + '\n'
+        + '__BRYTHON__.update_VFS(scripts);\n'
+        + FALLBACK % dict(left_out=json.dumps(left_out), out=OUT, full=FULL))
+
+    out = os.path.join(ROOT, OUT)
+    old = None
+    if os.path.exists(out):
+        with open(out, encoding='utf-8') as f:
+            old = f.read()
+    if bundle != old:
+        with open(out, 'w', encoding='utf-8') as f:
+            f.write(bundle)
+    update_sw_assets(bump=bundle != old)
+
+    full_size = os.path.getsize(os.path.join(ROOT, FULL))
+    print(f'{OUT}: {len(modules)} of {len(vfs)} modules, {len(bundle.encode()) / 1024:.0f} KiB '
+          f'(full {FULL}: {full_size / 1024:.0f} KiB)')
+    print('  ' + ' '.join(sorted(modules)))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+// Transpiles Python modules to JavaScript with the page's own brython.js,
+// the same way Brython does when it imports them in the browser.
+// Used by tools/build_app.py:
+//
+//   echo '{"brython": "brython.js", "modules": [{"name": ..., "path": ..., "is_package": ...}]}' | node compile_brython.js
+//
+// Prints {"implementation": ..., "lambda_magic": ..., "modules": {name: js}, "ms": {name: compile time}}.
+// With "parse": {name: js} in the request it also prints "parse_ms": {name: ms},
+// the median time V8 takes to parse each script.
+const fs = require("fs")
+const vm = require("vm")
+
+const request = JSON.parse(fs.readFileSync(0, "utf8"))
+
+// just enough of a browser for brython.js to load
+global.window = global.self = global
+global.module = {exports: {}}
+global.navigator = {userAgent: "node", language: "en"}
+global.location = {href: "http://localhost/index.html", protocol: "http:", origin: "http://localhost"}
+global.document = {
+    getElementsByTagName: () => [{src: "http://localhost/brython.js"}],
+    querySelectorAll: () => [],
+    addEventListener: () => {},
+    createElement: () => ({})
+}
+vm.runInThisContext(fs.readFileSync(request.brython, "utf8"), {filename: request.brython})
+
+const $B = __BRYTHON__
+$B.meta_path = $B.$meta_path.slice()
+$B.debug = 1    // what brython() uses when index.html passes no options
+$B.$options = {debug: 1}
+// random per page load otherwise. Lambdas and set comprehensions are named
+// with it, so the page has to use the same one (and the output stays the same)
+$B.lambda_magic = "prebuilt"
+
+const result = {implementation: String($B.implementation), lambda_magic: $B.lambda_magic, modules: {}, ms: {}}
+for (const m of request.modules) {
+    const start = process.hrtime.bigint()
+    const module = {__name__: m.name, __package__: m.is_package ? m.name : m.name.split(".").slice(0, -1).join(".")}
+    const src = {src: fs.readFileSync(m.path, "utf8"), has_annotations: false}
+    const root = $B.py2js(src, module, m.name, $B.builtins_scope)
+    root.binding["__package__"] = true
+    result.modules[m.name] = root.to_js()
+    result.ms[m.name] = Number(process.hrtime.bigint() - start) / 1e6
+}
+
+result.parse_ms = {}
+for (const name in request.parse || {}) {
+    const times = []
+    for (let i = 0; i < 5; i++) {
+        // a different source every time, V8 caches compiled scripts by source
+        const source = request.parse[name] + "\n// " + i
+        const start = process.hrtime.bigint()
+        new vm.Script(source)
+        times.push(Number(process.hrtime.bigint() - start) / 1e6)
+    }
+    result.parse_ms[name] = times.sort((a, b) => a - b)[2]
+}
+process.stdout.write(JSON.stringify(result))
@@ -0,0 +1,186 @@
+"""
+Pre-renders the main menu into index.html, so the page shows it as soon as the
+HTML is parsed instead of "loading..." until Brython has loaded and booted.
+
+main.py is booted under CPython with the `browser` stand-in in headless/, up
+to the menu, once per entry in VIEWPORTS. The elements under #game are
+written into index.html between the PRERENDER markers, as JSON and a few
+lines of JS that create them while the page is parsed (as HTML, the nested
+<button>s would be taken apart by the parser). The JS picks the desktop
+snapshot where .game has its fixed desktop size, the portrait one on portrait
+phones, and shows nothing (just "loading...") on landscape phones. At runtime
+the entities adopt those elements in the order they were created in (data-e,
+checked against the entity class in data-c) instead of creating new ones.
+Elements nothing adopted are removed after the first frame.
+
+    python tools/prerender_menu.py            # write it
+    python tools/prerender_menu.py --clear    # take it out again
+
+Run it again after changing the menu or anything it's built from. If the
+pre-render doesn't match the code anymore, the page throws it away and builds
+the menu from scratch. Also bumps the cache version in sw.js.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+
+from sw_assets import ROOT, update_sw_assets
+
+INDEX = 'index.html'
+START = '<!-- PRERENDER_START: generated by tools/prerender_menu.py, don\'t edit -->'
+END = '<!-- PRERENDER_END -->'
+
+VIEWPORTS = dict(desktop=(1536, 864), portrait=(390, 844))  # portrait: iPhone 12-15
+
+
+def snapshot(element, created):
+    """[tag, id, class, style, innerHTML, data-e, data-c, children] for element and its children."""
+    index, cls_name = created.get(id(element), (None, None))
+    return [element.tagName.lower(), element.id, element.className, element.style.cssText, element.innerHTML,
+        index, cls_name, [snapshot(child, created) for child in element.children]]
+
+
+# the same as pick() and build() below, run while index.html is parsed
+BUILD_JS = '''(function(views, parent){
+    // .game's desktop size applies from 768px, see the stylesheet in <head>
+    var view = matchMedia("(min-width: 768px)").matches ? views.desktop :
+        innerHeight > innerWidth ? views.portrait : null
+    if(!view){return}
+    document.getElementById("loading_text").style.display = "none"
+    parent.style.cssText += view.game
+    function build(n, parent){
+        var e = document.createElement(n[0])
+        if(n[1]){e.id = n[1]}
+        e.className = n[2]
+        e.style.cssText = n[3]
+        if(n[4]){e.innerHTML = n[4]}
+        if(n[5] !== null){e.setAttribute("data-e", n[5]); e.setAttribute("data-c", n[6])}
+        n[7].forEach(function(child){build(child, e)})
+        parent.appendChild(e)
+    }
+    view.nodes.forEach(function(n){build(n, parent)})
+})(%s, document.getElementById("game"))'''
+
+
+def pick(width, height):
+    """The name of the view BUILD_JS shows in a width x height viewport, None for none."""
+    if width >= 768:
+        return 'desktop'
+    return 'portrait' if height > width else None
+
+
+def build(nodes, parent, document):
+    """Create the elements of snapshot()s under parent, like BUILD_JS does in the page."""
+    for tag, id, class_name, css, inner, index, cls_name, children in nodes:
+        e = document.createElement(tag)
+        if id:
+            e.id = id
+        e.className = class_name
+        e.style.cssText = css
+        if inner:
+            e.innerHTML = inner
+        if index is not None:
+            e.setAttribute('data-e', index)
+            e.setAttribute('data-c', cls_name)
+        build(children, e, document)
+        parent.appendChild(e)
+
+
+def render(viewport):
+    """(stylesheet, #game's inline style, snapshot of its elements): the menu as main.py builds it, booted headless."""
+    sys.path[:0] = [os.path.join(ROOT, 'headless'), ROOT]
+    from browser import document
+    document.set_viewport(*viewport)
+    from ursina import entity as entity_module
+
+    # which element each entity got, in creation order
+    created = dict()
+    new_element = entity_module._new_element
+
+    def recording(cls_name):
+        element = new_element(cls_name)
+        created[id(element)] = (entity_module._created - 1, cls_name)
+        return element
+
+    entity_module._new_element = recording
+    import main     # boots CharadesApp into the menu and renders the first frame
+    assert main.app is not None
+
+    game = document.getElementById('game')
+    nodes = [snapshot(child, created) for child in game.children if child.id != 'loading_text']
+    return entity_module._stylesheet, game.style.cssText, nodes
+
+
+def render_all():
+    """{view: render() at its viewport}, each booted in a process of its own."""
+    views = dict()
+    for name, (width, height) in VIEWPORTS.items():
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), '--render', f'{width}x{height}'],
+            capture_output=True, text=True, check=True)
+        # main.py prints while booting, the result is the last line
+        views[name] = json.loads(result.stdout.splitlines()[-1])
+    return views
+
+
+def block(views):
+    """The lines between the markers."""
+    stylesheets = set(stylesheet for stylesheet, _, _ in views.values())
+    assert len(stylesheets) == 1, 'the stylesheet depends on the viewport'
+    data = {name: dict(game=game_css, nodes=nodes) for name, (_, game_css, nodes) in views.items()}
+    return [
+        f'<style id="ursina_style">{" ".join(stylesheets.pop().split())}</style>',
+        '<script>',
+        *(BUILD_JS % json.dumps(data, ensure_ascii=False).replace('</', '<\\/')).splitlines(),
+        '</script>',
+    ]
+
+
+def read_index():
+    """{view: dict(game=#game's inline style, nodes=snapshot()s)} pre-rendered into index.html, {} if there are none."""
+    with open(os.path.join(ROOT, INDEX), encoding='utf-8') as f:
+        source = f.read()
+    start = source.index(START)
+    source = source[start:source.index(END, start)]
+    if '})(' not in source:
+        return dict()
+    data = source[source.index('})(') + 3:source.rindex(', document.getElementById("game"))')]
+    return json.loads(data.replace('<\\/', '</'))
+
+
+def write_index(lines):
+    """Put lines between the markers in index.html. Returns True if it changed."""
+    path = os.path.join(ROOT, INDEX)
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+
+    match = re.search(r'\n( *)' + re.escape(START) + r'\n.*?' + re.escape(END), source, re.S)
+    assert match, f'no {START} ... {END} markers in {INDEX}'
+    indent = match.group(1)
+    block = '\n'.join(indent + line for line in [START] + lines + [END])
+    new = source[:match.start()] + '\n' + block + source[match.end():]
+    if new == source:
+        return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(new)
+    return True
+
+
+def main():
+    if '--render' in sys.argv[1:]:
+        viewport = sys.argv[sys.argv.index('--render') + 1].split('x')
+        print(json.dumps(render(tuple(int(v) for v in viewport)), ensure_ascii=False))
+        return
+    if '--clear' in sys.argv[1:]:
+        lines = []
+    else:
+        lines = block(render_all())
+    changed = write_index(lines)
+    update_sw_assets(bump=changed)
+    print(f'{INDEX}: {len("".join(lines).encode()) / 1024:.1f} KiB pre-rendered'
+          + ('' if changed else ' (unchanged)'))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
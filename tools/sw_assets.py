@@ -0,0 +1,49 @@
+"""
+Rewrites the ASSETS list in sw.js (between the ASSET_LIST_START/END markers)
+from the files the page actually loads, and bumps CACHE_NAME when the list
+changes so installed service workers pick it up.
+"""
+import os
+import re
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# served as-is, next to the ursina/*.py modules (build outputs only once they exist).
+# brython_stdlib.js isn't loaded up front, but brython_modules.js falls back to
+# it for imports the walk missed, so it's cached for offline use.
+STATIC_ASSETS = ['./', 'README.md', 'app_bundle.js', 'brython.js', 'brython_modules.js', 'brython_stdlib.js',
+    'index.html', 'main.py', 'manifest.json', 'sw.js', 'ursina.py']
+
+
+def served_files(extra=()):
+    files = [f for f in STATIC_ASSETS if f == './' or os.path.exists(os.path.join(ROOT, f))]
+    files += [f for f in extra if f not in files]
+    package = os.path.join(ROOT, 'ursina')
+    files += sorted('ursina/' + name for name in os.listdir(package) if name.endswith('.py'))
+    if os.path.exists(os.path.join(ROOT, 'app_bundle.js')):
+        # the page runs the game from the bundle, the sources are only fetched
+        # on localhost (see tools/build_app.py)
+        files = [f for f in files if f not in ('main.py', 'ursina.py') and not f.startswith('ursina/')]
+    return ['./' + f if f != './' else f for f in sorted(set(files), key=lambda f: (f != './', f))]
+
+
+def update_sw_assets(extra=(), bump=False, path=os.path.join(ROOT, 'sw.js')):
+    """
+    Write the asset list into sw.js. The cache version goes up when the list
+    changes, or with bump=True when a listed file was rebuilt. Returns True if
+    sw.js changed.
+    """
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+
+    listing = 'const ASSETS = [\n' + ',\n'.join(f'  "{a}"' for a in served_files(extra)) + '\n];'
+    start = source.index('// ASSET_LIST_START\n') + len('// ASSET_LIST_START\n')
+    end = source.index('\n// ASSET_LIST_END')
+    if source[start:end] == listing and not bump:
+        return False
+
+    source = source[:start] + listing + source[end:]
+    source = re.sub(r'(const CACHE_NAME = "[^"]*-v)(\d+)"', lambda m: f'{m.group(1)}{int(m.group(2)) + 1}"', source)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return True
@@ -1,20 +1,9 @@
-from ursina.sequence import Sequence, Func, Wait
-from ursina.entity import Entity
-from ursina.main import window
-from ursina.main import scene
-from ursina import color
-from ursina.input_handler import held_keys
-from ursina.main import mouse
-from ursina.main import invoke, destroy
-from ursina.main import Ursina
-from ursina.main import camera
+# Everything is imported on first use, see ursina.lazy.
+from ursina import lazy as _lazy
 
-from ursina.text import Text
-from ursina.text import Tooltip
-from ursina.button import Button
+__all__ = list(_lazy.exports)
+__getattr__ = _lazy.getattr_for(globals())
 
-from ursina.main import Entity as Panel
 
-from ursina.main import Empty
-from ursina.main import Empty as Quad
-from ursina.main import Empty as Circle
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
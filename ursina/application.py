@@ -0,0 +1,60 @@
+# Engine wide settings and state. Import the module (from ursina import application)
+# instead of copying values out of it, so everything sees the same ones.
+
+paused = False
+time_scale = 1
+trace_entity_definition = False # enable to set entity.line_definition
+print_entity_definition = False
+package_folder = ''
+asset_folder = ''
+development_mode = True
+print_startup_timeline = False   # print ursina.startup's timeline once the game has booted
+
+idle_after = 10             # quiet frames before the main loop parks itself
+idle = False
+frames_rendered = 0
+frames_skipped = 0          # estimated at 60 fps while the loop was parked
+max_dt = 1/10               # clamp for dt after long frames / throttled tabs
+fixed_time_step = None      # e.g. 1/60 to step sequences at a fixed rate
+
+
+
+class SequenceManager:
+    """
+    Every live Sequence, split into the ones that are running and the ones
+    that are paused or done. The main loop only updates the running ones.
+    """
+    def __init__(self):
+        # dicts as insertion-ordered sets: O(1) add/remove, stable update order
+        self.active = dict()
+        self.paused = dict()
+
+    def remove(self, sequence):
+        self.active.pop(sequence, None)
+        self.paused.pop(sequence, None)
+
+    def activate(self, sequence):
+        self.paused.pop(sequence, None)
+        self.active[sequence] = None
+
+    def deactivate(self, sequence):
+        self.active.pop(sequence, None)
+        self.paused[sequence] = None
+
+    def update(self):
+        for sequence in list(self.active):   # sequences may finish and remove themselves
+            if sequence in self.active:     # or get killed by an earlier one
+                sequence.update()
+
+    def __contains__(self, sequence):
+        return sequence in self.active or sequence in self.paused
+
+    def __len__(self):
+        return len(self.active) + len(self.paused)
+
+    def __iter__(self):
+        yield from self.active
+        yield from self.paused
+
+
+sequences = SequenceManager()
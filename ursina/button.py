@@ -1,7 +1,12 @@
-from ursina import *
+from ursina import color
+from ursina.entity import Entity
+from ursina.main import camera
+from ursina.text import Text
+from ursina.pool import pool
 
 
 class Button(Entity):
+    css_class = 'entity button'
     def __init__(self, text='', **kwargs):
         super().__init__()
         self.parent = camera.ui
@@ -14,7 +19,7 @@ class Button(Entity):
         # self.text_entity = None
         # if text:
         #     self.text = text
-        self.text_entity = Text(parent=self, origin=(0,0), add_to_scene_entities=False)
+        self.text_entity = pool.acquire(Text, parent=self, origin=(0,0), add_to_scene_entities=False)
         self.text = text
 
         # self.icon = None
@@ -26,7 +31,7 @@ class Button(Entity):
     def __setattr__(self, name, value):
         super().__setattr__(name, value)
         if name == 'text':              self.text_entity.b.innerHTML = value
-        if name == 'text_color':        self.text_entity.b.style.fontColor = value
+        if name == 'text_color':        self.text_entity._set_style('color', value)
         if name == 'color':             self._original_color = value
 
 
@@ -46,7 +51,7 @@ class Button(Entity):
 
     def on_mouse_enter(self):
         self._original_color = self.color
-        self.b.style.backgroundColor = self.highlight_color
+        self._set_style('background-color', self.highlight_color)
 
     def on_mouse_exit(self):
-        self.b.style.backgroundColor = self._original_color
+        self._set_style('background-color', self._original_color)
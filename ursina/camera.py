@@ -14,6 +14,9 @@ class Camera(Entity):
         # the UI overflow and get cropped left/right in iOS standalone web apps.
         self.ui = Entity(name='ui', z=-100, scale_x=1/max(1, self.aspect_ratio))
         _window.appendChild(self.ui.b)
+        # the ui lives directly in the window, not in the scene
+        scene.children.remove(self.ui)
+        object.__setattr__(self.ui, '_parent', None)
         self.name = 'camera'
 
 
@@ -54,8 +57,8 @@ class Camera(Entity):
     def y(self):
         return self._y
 
-    @x.setter
-    def x(self, value):
+    @y.setter
+    def y(self, value):
         self._y = value
         scene.y = -value / self.fov
 
@@ -1,17 +1,113 @@
 from browser import document
 _window = document.getElementById('game')
 from ursina import color
+from ursina.hit_grid import HitGrid
+
+
+
+# Styles every entity shares live in one stylesheet, elements just get a class.
+# Only per-instance values (position, size, color, ...) are written inline.
+_stylesheet = '''
+.entity {width:100%; height:100%; position:absolute; top:50%; left:50%; will-change: transform;
+        transform:translate(-50%, -50%); font-size:50; color:black; background-size: 100% 100%; padding:0;
+        border-radius: 128px; border-style:solid; border-width:0px; border-color: white;}
+.quad {border-radius:0%;}
+.text {white-space:pre; overflow:visible; vertical-align:text-top; pointer-events:none;}
+'''
+
+def _install_stylesheet():
+    style = document.createElement('style')
+    style.id = 'ursina_style'
+    style.innerHTML = _stylesheet
+    document.head.appendChild(style)
+
+if document.getElementById('ursina_style') is None:
+    _install_stylesheet()
+
+# Style changes are buffered per entity and written to the DOM in one go by
+# flush_styles(), which the main loop calls once per frame. Going through the
+# Brython -> JS bridge for every single style property is slow.
+_dirty_entities = list()
+style_stats = dict(requested=0, written=0, saved=0)
+wake_loop = None    # set by Ursina.run(), so style changes made outside a frame get flushed
+
+
+def flush_styles():
+    if not _dirty_entities:
+        return
+
+    for e in _dirty_entities:
+        if e._style_dirty:  # recycled entities are skipped, see Entity._recycle()
+            e._flush_style()
+
+    _dirty_entities.clear()
+    style_stats['saved'] = style_stats['requested'] - style_stats['written']
+
+
+# Elements pre-rendered into index.html by tools/prerender_menu.py, by the
+# order they were created in at build time (data-e). Until the first frame,
+# entities adopt them instead of creating their own, see end_hydration().
+_prerendered = dict()
+_created = 0    # elements entities have created (or adopted) so far
+
+for _element in document.querySelectorAll('[data-e]'):
+    _prerendered[int(_element.getAttribute('data-e'))] = _element
+
+
+def _new_element(cls_name):
+    global _created
+    element = None
+    if _prerendered:
+        element = _prerendered.pop(_created, None)
+        if element is not None and element.getAttribute('data-c') != cls_name:
+            # pre-rendered from other code than this, don't adopt any of it
+            _prerendered[_created] = element
+            end_hydration()
+            element = None
+    if element is None:
+        element = document.createElement("button")
+    _created += 1
+    return element
+
+
+def end_hydration():
+    """Remove the pre-rendered elements no entity adopted, new entities create their own from now on."""
+    for element in _prerendered.values():
+        element.remove()
+    _prerendered.clear()
+
+
+# Entities the main loop has to call every frame / on every input event.
+# Dicts are used as insertion-ordered sets, so update order stays stable.
+updatables = dict()
+input_receivers = dict()
+
+# Collision entities by screen position, used by Mouse for hovering.
+hit_grid = HitGrid()
+_hit_attrs = ('x', 'y', 'scale_x', 'scale_y', 'origin', 'parent', 'collision')
+
+# Set entity.animated = True on things that move or resize a lot. Their
+# position, scale and origin then go into a single transform instead of
+# left/top/width/height, so changing them doesn't make the browser lay out
+# the page again. The element's content is scaled along with it, so use it
+# for plain quads, or for entities that keep a scale of 1 (like Tooltip).
+_transform_attrs = ('x', 'y', 'scale_x', 'scale_y', 'origin')
 
 
 
 class Entity:
+    css_class = 'entity'    # class names from _stylesheet, subclasses extend it
+
     def __init__(self, add_to_scene_entities=True, **kwargs):
-        self.b = document.createElement("button")
+        object.__setattr__(self, '_css', dict())
+        object.__setattr__(self, '_style_dirty', False)
+        object.__setattr__(self, '_parent', None)
+        object.__setattr__(self, 'children', list())
+        b = self.__dict__.get('b')  # reuse the element of a recycled entity
+        self.b = b if b is not None else _new_element(type(self).__name__)
         self.b.entity = self
         # print('-------------', self.b.entity)
-        self.b.style.cssText = '''width:100%; height:100%; position:absolute; top:50%; left:50%; will-change: transform;
-        transform:translate(-50%, -50%); font-size:50; color:black; background-size: 100% 100%; padding:0;
-        border-radius: 128px; border-style:solid; border-width:0px; border-color: white;'''
+        self._mark_style_dirty()
         self.enabled = True
         self.ignore = False
         self.add_to_scene_entities = add_to_scene_entities # set to False to be ignored by the engine, but still get rendered.
@@ -31,7 +127,7 @@ class Entity:
         # self.origin_x = 0
         # self.origin_y = 0
 
-        self.model = None
+        self.model = None   # also sets the element's class names
         self.color = color.white
         self.hovered = False
         self.collision = False
@@ -40,13 +136,21 @@ class Entity:
         for key, value in kwargs.items():
             setattr(self, key ,value)
 
+        self._register_hooks()
+
 
 
     def __setattr__(self, name, value):
         object.__setattr__(self, name, value)
-        if name == 'x':             self.b.style.left = f'{50+(value*100)}%'
-        elif name == 'y':           self.b.style.top = f'{50+(-value*100)}%'
-        elif name == 'z':           self.b.style.zIndex = -value
+        if name in _hit_attrs:
+            hit_grid.mark_dirty(self)
+
+        if name in _transform_attrs and self.__dict__.get('animated'):
+            self._set_transform()
+
+        elif name == 'x':             self._set_style('left', f'{50+(value*100)}%')
+        elif name == 'y':           self._set_style('top', f'{50+(-value*100)}%')
+        elif name == 'z':           self._set_style('z-index', -value)
 
         elif name == 'position':
             self.x = value[0]
@@ -54,44 +158,68 @@ class Entity:
             if len(value)==3:
                 self.z=value[2]
 
-        elif name == 'scale_x':     self.b.style.width = f'{value*100}%'
-        elif name == 'scale_y':     self.b.style.height = f'{value*100}%'
+        elif name == 'scale_x':     self._set_style('width', f'{value*100}%')
+        elif name == 'scale_y':     self._set_style('height', f'{value*100}%')
         elif name == 'scale':
             if isinstance(value, (int, float, complex)):
                 value = (value, value)
             self.scale_x = value[0];
             self.scale_y = value[1]
 
-        elif name == 'world_scale_x': self.b.style.width = f'{value*window.width}px'
-        elif name == 'world_scale_y': self.b.style.height = f'{value*window.height}px'
+        elif name == 'world_scale_x': self._set_style('width', f'{value*window.width}px')
+        elif name == 'world_scale_y': self._set_style('height', f'{value*window.height}px')
         elif name == 'world_scale':
             if isinstance(value, (int, float, complex)):
                 value = (value, value)
             self.scale_x = value[0];
             self.scale_y = value[1]
 
-        elif name == 'origin':      self.b.style.transform = f'translate({(-value[0]-.5)*100}%, {(value[1]-.5)*100}%)'
+        elif name == 'origin':      self._set_style('transform', f'translate({(-value[0]-.5)*100}%, {(value[1]-.5)*100}%)')
 
 
         # elif name == 'ignore':
         #     if self.update
 
-        elif name == 'enabled':     self.visible = value
-        elif name == 'visible':     self.b.style.visibility  = ('hidden', 'inherit')[int(value)]
+        elif name == 'animated':
+            if value:
+                for k, v in (('left', '0%'), ('top', '0%'), ('width', '100%'), ('height', '100%'), ('transform-origin', '0 0')):
+                    self._set_style(k, v)
+                self._set_transform()
+            else:
+                self._css.pop('transform-origin', None)
+                self._css.pop('transform', None)
+                for attr in _transform_attrs:   # write them the regular way again
+                    if attr in self.__dict__:
+                        setattr(self, attr, self.__dict__[attr])
+
+        elif name == 'enabled':
+            self.visible = value
+            self._register_hooks()
+        elif name == 'visible':     self._set_style('visibility', ('hidden', 'inherit')[int(value)])
         elif name == 'model':
-            if value == None:       self.b.style.backgroundColor = color.clear
-            elif value == 'quad':   self.b.style.borderRadius = '0%'
+            if value == None:       self._set_style('background-color', color.clear)
+            classes = self.css_class + (' quad' if value == 'quad' else '')
+            if self.__dict__.get('_classes') != classes:
+                object.__setattr__(self, '_classes', classes)
+                self.b.className = classes
 
         # if name == 'text': self.b.style.innerHTML = value
-        elif name == 'update':
-            if callable(value): timer.set_interval(value, 60)
-            else:               timer.clear_interval(update)
+        elif name in ('update', 'input', 'scripts'):
+            self._register_hooks()
 
-        elif name == 'parent':      value.b.appendChild(self.b)
-        elif name == 'color' and self.model: self.b.style.backgroundColor = value
-        elif name == 'texture':     self.b.style.backgroundImage = f"url('{value}.jpg'), url('{value}.png')"
+        elif name == 'parent':
+            old_parent = self._parent
+            if old_parent is not None and self in old_parent.children:
+                old_parent.children.remove(self)
+            if hasattr(value, 'children'):
+                value.children.append(self)
+            object.__setattr__(self, '_parent', value)
+            value.b.appendChild(self.b)
 
-        elif name == 'collision':   self.b.style.pointerEvents = ['none', 'all'][bool(value)]
+        elif name == 'color' and self.model: self._set_style('background-color', value)
+        elif name == 'texture':     self._set_style('background-image', f"url('{value}.jpg'), url('{value}.png')")
+
+        elif name == 'collision':   self._set_style('pointer-events', ['none', 'all'][bool(value)])
         elif name == 'name':        self.b.id = value
 
 
@@ -110,5 +238,72 @@ class Entity:
             self.origin = (self.origin[0], value)
 
 
+    def _register_hooks(self):
+        # Only entities in the scene that are enabled and actually define
+        # update/input (or have scripts) get visited by the main loop.
+        active = self.enabled and getattr(self, 'add_to_scene_entities', False)
+        scripted = hasattr(self, 'scripts')
+
+        if active and (scripted or hasattr(self, 'update')):
+            updatables[self] = None
+        else:
+            updatables.pop(self, None)
+
+        if active and (scripted or hasattr(self, 'input')):
+            input_receivers[self] = None
+        else:
+            input_receivers.pop(self, None)
+
+    def _unregister_hooks(self):
+        updatables.pop(self, None)
+        input_receivers.pop(self, None)
+
+    def _recycle(self):
+        # Called by ursina.pool when a destroyed entity is put back into the
+        # pool: forget everything but the DOM element, so __init__ can set
+        # the entity up again from scratch.
+        b = self.b
+        if self.children:
+            b.innerHTML = ''    # the children are recycled on their own
+        if '_on_click' in self.__dict__:
+            b.onclick = None
+
+        classes = self.__dict__.get('_classes')
+        self.__dict__.clear()
+        object.__setattr__(self, 'b', b)
+        object.__setattr__(self, '_classes', classes)   # the element keeps its className
+        object.__setattr__(self, '_style_dirty', False)
+        object.__setattr__(self, '_parent', None)
+        object.__setattr__(self, 'children', list())
+
+    def _set_transform(self):
+        # Same box as left/top/width/height + the origin translate(), but the
+        # element stays the size of its parent and gets scaled instead. That
+        # makes translate() percentages relative to the parent, like left/top.
+        sx, sy = self.scale_x, self.scale_y
+        ox, oy = self.__dict__.get('origin', (0, 0))[:2]
+        left = 50 + self.x*100 + (-ox-.5)*sx*100
+        top = 50 - self.y*100 + (oy-.5)*sy*100
+        self._set_style('transform', f'translate({left}%, {top}%) scale({sx}, {sy})')
+
+    def _set_style(self, name, value):
+        self._css[name] = value
+        style_stats['requested'] += 1
+        self._mark_style_dirty()
+
+    def _mark_style_dirty(self):
+        if not self._style_dirty:
+            if not _dirty_entities and wake_loop:
+                wake_loop()
+            object.__setattr__(self, '_style_dirty', True)
+            _dirty_entities.append(self)
+
+    def _flush_style(self):
+        # one cssText write instead of one write per property
+        self.b.style.cssText = ''.join([f'{k}:{v};' for k, v in self._css.items()])
+        object.__setattr__(self, '_style_dirty', False)
+        style_stats['written'] += 1
+
+
     def __del__(self):
         self.b.remove()
@@ -0,0 +1,109 @@
+# Python side hit testing for collision entities, so hovering doesn't have to
+# go through document.elementsFromPoint (and the browser's layout) every poll.
+#
+# Rects are kept in window space: (0,0) is the top left and (1,1) the bottom
+# right of the game element, the same way the entities are laid out with
+# left/top/width/height percentages.
+
+
+class HitGrid:
+    def __init__(self, cells=16):
+        self.cells = cells
+        self.buckets = dict()   # (column, row) -> list of entities
+        self.rects = dict()     # entity -> (x0, y0, x1, y1, cell keys)
+        self.order = dict()     # entity -> creation order, later is drawn on top
+        self._dirty = dict()    # used as an ordered set
+        self._counter = 0
+
+
+    def mark_dirty(self, entity):
+        # Moving/scaling an entity moves all of its children too.
+        stack = [entity, ]
+        while stack:
+            e = stack.pop()
+            self._dirty[e] = None
+            stack.extend(e.children)
+
+
+    def remove(self, entity):
+        self._dirty.pop(entity, None)
+        self.order.pop(entity, None)
+        if entity in self.rects:
+            for key in self.rects.pop(entity)[4]:
+                self.buckets[key].remove(entity)
+
+
+    def refresh(self):
+        if not self._dirty:
+            return
+
+        for e in self._dirty:
+            if e in self.rects:
+                for key in self.rects.pop(e)[4]:
+                    self.buckets[key].remove(e)
+
+            if not getattr(e, 'collision', False):
+                continue
+
+            if e not in self.order:
+                self.order[e] = self._counter
+                self._counter += 1
+
+            x0, y0, x1, y1 = world_rect(e)
+            last = self.cells - 1
+            c0, c1 = max(0, min(last, int(x0 * self.cells))), max(0, min(last, int(x1 * self.cells)))
+            r0, r1 = max(0, min(last, int(y0 * self.cells))), max(0, min(last, int(y1 * self.cells)))
+            keys = [(c, r) for c in range(c0, c1+1) for r in range(r0, r1+1)]
+            for key in keys:
+                self.buckets.setdefault(key, list()).append(e)
+
+            self.rects[e] = (x0, y0, x1, y1, keys)
+
+        self._dirty.clear()
+
+
+    def hits_at(self, x, y):
+        """Collision entities under the point, topmost first."""
+        self.refresh()
+        if not (0 <= x <= 1 and 0 <= y <= 1):
+            return []
+
+        last = self.cells - 1
+        key = (min(last, int(x * self.cells)), min(last, int(y * self.cells)))
+        hits = list()
+        for e in self.buckets.get(key, ()):
+            x0, y0, x1, y1, _ = self.rects[e]
+            if x0 <= x <= x1 and y0 <= y <= y1 and is_shown(e):
+                hits.append(e)
+
+        hits.sort(key=self.order.__getitem__, reverse=True)
+        return hits
+
+
+
+def world_rect(entity):
+    """(left, top, right, bottom) of the entity in window space."""
+    parent = entity._parent
+    if parent is None:
+        px, py, pw, ph = 0, 0, 1, 1
+    else:
+        x0, y0, x1, y1 = world_rect(parent)
+        px, py, pw, ph = x0, y0, x1-x0, y1-y0
+
+    w = getattr(entity, 'scale_x', 1) * pw
+    h = getattr(entity, 'scale_y', 1) * ph
+    anchor_x = px + (.5 + getattr(entity, 'x', 0)) * pw
+    anchor_y = py + (.5 - getattr(entity, 'y', 0)) * ph
+    origin = getattr(entity, 'origin', (0, 0))
+
+    left = anchor_x + (-origin[0] - .5) * w
+    top = anchor_y + (origin[1] - .5) * h
+    return (left, top, left + w, top + h)
+
+
+def is_shown(entity):
+    while entity is not None:
+        if not getattr(entity, 'visible', True):
+            return False
+        entity = entity._parent
+    return True
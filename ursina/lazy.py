@@ -0,0 +1,64 @@
+# What `from ursina import ...` offers and which submodule each name comes from.
+# The package imports a submodule the first time one of its names is used, so
+# e.g. `from ursina import color` doesn't build the window, camera and scene.
+import sys
+import time
+
+
+exports = {
+    # name: (module, attribute), None for the module itself
+    'application': ('ursina.application', None),
+    'color': ('ursina.color', None),
+    'Sequence': ('ursina.sequence', 'Sequence'),
+    'Func': ('ursina.sequence', 'Func'),
+    'Wait': ('ursina.sequence', 'Wait'),
+    'Entity': ('ursina.entity', 'Entity'),
+    'held_keys': ('ursina.input_handler', 'held_keys'),
+    'window': ('ursina.main', 'window'),
+    'scene': ('ursina.main', 'scene'),
+    'mouse': ('ursina.main', 'mouse'),
+    'camera': ('ursina.main', 'camera'),
+    'invoke': ('ursina.main', 'invoke'),
+    'destroy': ('ursina.main', 'destroy'),
+    'Ursina': ('ursina.main', 'Ursina'),
+    'Panel': ('ursina.main', 'Entity'),
+    'Empty': ('ursina.main', 'Empty'),
+    'Quad': ('ursina.main', 'Empty'),
+    'Circle': ('ursina.main', 'Empty'),
+    'Text': ('ursina.text', 'Text'),
+    'Tooltip': ('ursina.text', 'Tooltip'),
+    'Button': ('ursina.button', 'Button'),
+}
+
+# (name, modules its first use imported, ms), in the order they happened
+loaded = list()
+
+
+def getattr_for(namespace):
+    """The module level __getattr__ for a package whose globals() are namespace."""
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        module_name, attr = exports[name]
+        before = set(sys.modules)
+        start = time.perf_counter()
+        __import__(module_name)
+        module = sys.modules[module_name]
+        value = module if attr is None else getattr(module, attr)
+        ms = (time.perf_counter() - start) * 1000
+        imported = [m for m in sys.modules if m not in before]
+        if imported:
+            loaded.append((name, imported, ms))
+        namespace[name] = value     # only looked up once
+        return value
+
+    return __getattr__
+
+
+def report():
+    """Which names pulled in which modules, and how long that took (nested imports included)."""
+    lines = [f'{ms:8.1f} ms  {name}: {", ".join(modules)}' for name, modules, ms in loaded]
+    lines.append(f'{sum(ms for _, _, ms in loaded):8.1f} ms  total')
+    return '\n'.join(lines)
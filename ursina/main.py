@@ -1,25 +1,53 @@
 import __main__
+import sys
+from collections import deque
 from browser import document
 from browser import timer
 import browser
 _window = document.getElementById('game')
 from ursina import input_handler
 from ursina import color
-# from ursina import application
+from ursina.entity import flush_styles, style_stats, updatables, input_receivers, hit_grid
+from ursina.sequence import Sequence, Func, Wait
+from ursina import entity as entity_module
+from ursina import sequence as sequence_module
+from ursina.pool import pool
+from ursina import application
+from ursina.startup import timeline as startup
 class Empty:
     def __init__(self, *args, **kwargs):
         for key, value in kwargs.items():
             setattr(self, key ,value)
 
-application = Empty()
-application.paused = False
-application.time_scale = 1
-application.sequences = list()
-application.trace_entity_definition = False # enable to set entity.line_definition
-application.print_entity_definition = False
-application.package_folder = ''
-application.asset_folder = ''
-application.development_mode = True
+application.style_stats = style_stats   # batched entity style writes, see ursina.entity.flush_styles
+
+
+class FrameTimes:
+    """Rolling window of frame times in ms, for perf monitoring."""
+    def __init__(self, size=240):
+        self.samples = deque(maxlen=size)
+
+    def add(self, ms):
+        self.samples.append(ms)
+
+    def percentile(self, p):
+        if not self.samples:
+            return 0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered)-1, int(len(ordered) * p / 100))]
+
+    @property
+    def p50(self): return self.percentile(50)
+    @property
+    def p95(self): return self.percentile(95)
+    @property
+    def max(self): return max(self.samples) if self.samples else 0
+
+    def summary(self):
+        return dict(p50=self.p50, p95=self.p95, max=self.max, frames=len(self.samples))
+
+application.frame_times = FrameTimes()
+application.pool_stats = pool.stats     # entity pool hits/misses, see ursina.pool
 
 class Window():
     def __init__(self, **kwargs):
@@ -107,7 +135,8 @@ class Window():
 
 
 
-window = Window()
+with startup.phase('Window()'):
+    window = Window()
 
 
 from ursina import Entity
@@ -118,7 +147,10 @@ _window.appendChild(scene.b)
 # mouse = Empty()
 
 from ursina.camera import Camera
-camera = Camera()
+with startup.phase('Camera()'):
+    camera = Camera()
+# importing ursina.camera set the package's `camera` to that module, see ursina.lazy
+sys.modules['ursina'].camera = camera
 class Mouse():
     def __init__(self):
         self.enabled = True
@@ -139,6 +171,9 @@ class Mouse():
 
         self.i = 0
         self.update_rate = 10
+        self.touches = dict()           # touch identifier -> (client x, client y)
+        self.hovered_entities = dict()  # used as an ordered set
+        self._hover_pending = False     # a pointer moved since the last hit test
         # self._mouse_event = None
 
 
@@ -188,13 +223,52 @@ class Mouse():
 
 
     def update(self):
-        if not self.enabled or not hasattr(self, '_mouse_event'):
+        # with the last finger lifted there's no pointer left, but what it was
+        # on still has to be unhovered once
+        if not self.enabled or (not hasattr(self, '_mouse_event') and not self.touches and not self._hover_pending):
             self.velocity = (0,0)
             self.moving = False
             return
 
-        event = self._mouse_event
+        if hasattr(self, '_mouse_event'):
+            self._update_position(self._mouse_event)
+
+
+        self.i += 1
+        if self.i < self.update_rate:
+            return
+
+        self.i = 0
+        self._hover_pending = False
+
+        # one pointer per touch, plus the mouse itself
+        pointers = list(self.touches.values())
+        if hasattr(self, '_mouse_event'):
+            pointers.insert(0, (self._mouse_event.x, self._mouse_event.y))
+
+        position = window.position
+        size = window.size
+        hovered = dict()
+        self.hits = list()
+        for x, y in pointers:
+            hits = hit_grid.hits_at((x-position[0]) / size[0], (y-position[1]) / size[1])
+            if hits:
+                hovered[hits[0]] = None
+            self.hits.extend(hits)
 
+        self.hovered_entity = self.hits[0] if self.hits else None
+        self.unhover_everything_not_hit(hovered)
+
+        for e in hovered:
+            if not e.hovered:
+                e.hovered = True
+                if hasattr(e, 'on_mouse_enter'):
+                    e.on_mouse_enter()
+
+        self.hovered_entities = hovered
+
+
+    def _update_position(self, event):
         self.x = min(max((event.x-window.position[0]-(window.size[0]/2))/window.size[0]*window.aspect_ratio, -window.aspect_ratio/2,), window.aspect_ratio/2)
         self.y = min(max(((-event.y+window.position[1])/window.size[1]) +.5, -.5), .5)
 
@@ -217,31 +291,10 @@ class Mouse():
         self.prev_y = self.y
 
 
-        self.i += 1
-        if self.i < self.update_rate:
-            return
-
-        self.i = 0
-
-        self.hits = [e.entity for e in document.elementsFromPoint(event.x, event.y) if hasattr(e, 'entity')]
-
-        if not self.hits:
-            self.hovered_entity = None
-
-        else:
-            self.hovered_entity = self.hits[0]
-
-            if not self.hovered_entity.hovered:
-                self.hovered_entity.hovered = True
-                if hasattr(self.hovered_entity, 'on_mouse_enter'):
-                    self.hovered_entity.on_mouse_enter()
-
-        self.unhover_everything_not_hit()
-
-
-    def unhover_everything_not_hit(self):
-        for e in scene.entities:
-            if e == self.hovered_entity:
+    def unhover_everything_not_hit(self, hovered):
+        # only the previously hovered entities can need an exit
+        for e in self.hovered_entities:
+            if e in hovered:
                 continue
 
             if e.hovered:
@@ -251,7 +304,8 @@ class Mouse():
 
 
 import time
-mouse = Mouse()
+with startup.phase('Mouse()'):
+    mouse = Mouse()
 
 
 class Ursina:
@@ -285,11 +339,30 @@ class Ursina:
         def _mousemove(event):
             # mouse.update(event)
             mouse._mouse_event = event
+            mouse._hover_pending = True
+            self.wake()
+
+        # every finger on the screen is tracked as its own pointer for hovering
+        def _touchmove(event):
+            for i in range(event.changedTouches.length):
+                t = event.changedTouches.item(i)
+                mouse.touches[t.identifier] = (t.clientX, t.clientY)
+            mouse._hover_pending = True
+            self.wake()
+        def _touchend(event):
+            for i in range(event.changedTouches.length):
+                mouse.touches.pop(event.changedTouches.item(i).identifier, None)
+            mouse._hover_pending = True
+            self.wake()
 
         document.addEventListener('mousedown', _mousedown)
         document.addEventListener("mouseup", _mouseup)
         document.addEventListener("wheel", _mousescroll)
         document.addEventListener("mousemove", _mousemove)
+        document.addEventListener("touchstart", _touchmove)
+        document.addEventListener("touchmove", _touchmove)
+        document.addEventListener("touchend", _touchend)
+        document.addEventListener("touchcancel", _touchend)
 
 
 
@@ -315,6 +388,7 @@ class Ursina:
 
 
     def input(self, key):
+        self.wake()
         if not isinstance(key, str):
             if key.repeat:
                 self.input_hold(key.key)
@@ -341,24 +415,44 @@ class Ursina:
                 __main__.input(key)
 
 
-        for entity in scene.entities:
-            if entity.enabled:
-                if hasattr(entity, 'input'):
-                    entity.input(key)
+        for entity in list(input_receivers):
+            if hasattr(entity, 'input'):
+                entity.input(key)
 
-                if hasattr(entity, 'scripts'):
-                    for script in entity.scripts:
-                        if hasattr(script, 'input'):
-                            script.input(key)
+            if hasattr(entity, 'scripts'):
+                for script in entity.scripts:
+                    if hasattr(script, 'input'):
+                        script.input(key)
 
 
 
     def run(self):
-        def _update_wrapper(i):
-            timer.request_animation_frame(_update_wrapper)
+        self._quiet_frames = 0
+        self._parked_at = None
+        self._prev_frame_time = None
+        self._accumulator = 0
 
-            # time between frames
-            dt = 1/60 * application.time_scale
+        def _update_wrapper(i):
+            # Nothing happened for a while (static menu): don't request more
+            # frames until wake() is called by an input event, a started
+            # Sequence or an entity style change.
+            if self._quiet_frames >= application.idle_after:
+                application.idle = True
+                self._parked_at = time.time()
+            else:
+                timer.request_animation_frame(_update_wrapper)
+
+            application.frames_rendered += 1
+            # time between frames, from the requestAnimationFrame timestamp (ms)
+            if i is None or self._prev_frame_time is None:
+                dt = 1/60
+            else:
+                dt = (i - self._prev_frame_time) / 1000
+                application.frame_times.add(i - self._prev_frame_time)
+                dt = min(max(dt, 0), application.max_dt)
+            self._prev_frame_time = i
+
+            dt *= application.time_scale
             time.dt = dt
 
             mouse.update()
@@ -366,14 +460,23 @@ class Ursina:
             if hasattr(__main__, 'update') and not application.paused:
                 __main__.update()
 
-            for seq in application.sequences:
-                seq.update()
-
-            for entity in scene.entities:
-                if entity.enabled == False or entity.ignore:
+            if application.fixed_time_step:
+                # deterministic: sequences always advance in whole fixed steps
+                self._accumulator += dt
+                step = application.fixed_time_step * application.time_scale
+                time.dt = step
+                while self._accumulator >= step:
+                    self._accumulator -= step
+                    application.sequences.update()
+                time.dt = dt
+            else:
+                application.sequences.update()
+
+            for entity in list(updatables):
+                if entity.ignore:
                     continue
 
-                if application.paused and entity.ignore_paused == False:
+                if application.paused and getattr(entity, 'ignore_paused', False) == False:
                     continue
 
                 if hasattr(entity, 'update'):
@@ -385,11 +488,46 @@ class Ursina:
                         if script.enabled and hasattr(script, 'update'):
                             script.update()
 
-        _update_wrapper(0)
+            flush_styles()
+
+            if self._has_work():
+                self._quiet_frames = 0
+            else:
+                self._quiet_frames += 1
+
+        self._update_wrapper = _update_wrapper
+        entity_module.wake_loop = self.wake
+        sequence_module.wake_loop = self.wake
+        with startup.phase('first frame'):
+            _update_wrapper(None)
 
         loading_text = document.getElementById('loading_text');
         loading_text.remove();
-        # pass
+        startup.mark('loading_text removed')
+        entity_module.end_hydration()
+        # the browser has painted by the time the next frame starts
+        timer.request_animation_frame(lambda t: startup.finish('first animation frame'))
+
+
+    def _has_work(self):
+        if hasattr(__main__, 'update') or updatables:
+            return True
+        if mouse._hover_pending:
+            return True     # hover check for the last pointer move is still pending
+        if application.sequences.active:
+            return True
+        return False
+
+
+    def wake(self):
+        self._quiet_frames = 0
+        if not application.idle:
+            return
+
+        application.idle = False
+        application.frames_skipped += int((time.time() - self._parked_at) * 60)
+        self._prev_frame_time = None    # don't count the parked time as one long frame
+        timer.request_animation_frame(self._update_wrapper)
 
 
 
@@ -418,8 +556,55 @@ def _destroy(entity):
     if not entity:
         print('entity is None')
         return
-    if entity in scene.entities:
-        scene.entities.remove(entity)
+
+    # destroy the whole subtree at once: one pass over scene.entities and one
+    # DOM removal for the root, since the children's elements live inside it.
+    subtree = _collect_subtree(entity)
+    doomed = set(subtree)
+    scene.entities[:] = [e for e in scene.entities if e not in doomed]
+    if mouse.hovered_entity in doomed:
+        mouse.hovered_entity = None
+    for e in [e for e in mouse.hovered_entities if e in doomed]:
+        del mouse.hovered_entities[e]
+
+    for e in subtree:
+        _destroy_single(e)
+
+    parent = entity._parent
+    if parent is not None and entity in parent.children:
+        parent.children.remove(entity)
+    object.__setattr__(entity, '_parent', None)
+
+    entity.b.remove()
+
+    for e in subtree:
+        if getattr(e, '_pooled', False):
+            pool.release(e)
+        else:
+            e.children.clear()
+
+    #unload texture
+    # if hasattr(entity, 'texture') and entity.texture != None:
+    #     entity.texture.releaseAll()
+
+    del entity
+
+
+def _collect_subtree(entity):
+    subtree = [entity, ]
+    i = 0
+    while i < len(subtree):
+        subtree.extend(subtree[i].children)
+        i += 1
+    return subtree
+
+
+def _destroy_single(entity):
+    # no longer part of the scene, so re-enabling it can't register it again
+    object.__setattr__(entity, 'add_to_scene_entities', False)
+    entity._unregister_hooks()
+    object.__setattr__(entity, 'collision', False)  # keeps it out of the hit grid if touched later
+    hit_grid.remove(entity)
 
     if hasattr(entity, 'on_destroy'):
         entity.on_destroy()
@@ -438,12 +623,3 @@ def _destroy(entity):
         # entity.tooltip.removeNode()
     if hasattr(entity, '_on_click') and isinstance(entity._on_click, Sequence):
         entity._on_click.kill()
-
-
-    entity.b.remove()
-
-    #unload texture
-    # if hasattr(entity, 'texture') and entity.texture != None:
-    #     entity.texture.releaseAll()
-
-    del entity
@@ -0,0 +1,49 @@
+# Recycles entities (and their DOM elements) instead of creating new ones for
+# every screen build. Only entities made with pool.acquire() go back into the
+# pool when they're destroyed, see ursina.main._destroy().
+
+
+class EntityPool:
+    def __init__(self, max_size=128):
+        self.max_size = max_size    # free entities kept per class
+        self.free = dict()          # class -> list of released entities
+        self.stats = dict(hits=0, misses=0, released=0, dropped=0)
+
+
+    def acquire(self, cls, *args, **kwargs):
+        free = self.free.get(cls)
+        if free:
+            self.stats['hits'] += 1
+            entity = free.pop()
+            cls.__init__(entity, *args, **kwargs)
+        else:
+            self.stats['misses'] += 1
+            entity = cls(*args, **kwargs)
+
+        object.__setattr__(entity, '_pooled', True)
+        return entity
+
+
+    def release(self, entity):
+        free = self.free.setdefault(type(entity), list())
+        if len(free) >= self.max_size:
+            self.stats['dropped'] += 1
+            return
+
+        entity._recycle()
+        free.append(entity)
+        self.stats['released'] += 1
+
+
+    def clear(self):
+        self.free.clear()
+
+
+    @property
+    def hit_rate(self):
+        total = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / total if total else 0
+
+
+
+pool = EntityPool()
@@ -1,11 +1,7 @@
 # from ursina import *
 import math
-# from ursina import application
-class Empty:
-    def __init__(self, *args, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key ,value)
-application = Empty(sequences=list(), time_scale=1)
+from ursina import application
+wake_loop = None    # set by Ursina.run(), so starting a Sequence wakes an idle main loop
 
 import time
 
@@ -38,8 +34,9 @@ class Sequence():
         self.t = 0
         self.time_step = Sequence.default_time_step
         self.duration = 0
-        self.funcs = list()
-        self.paused = True
+        self.funcs = list()     # in delay order, since each Func gets the duration so far
+        self._cursor = 0        # index of the next Func to call
+        self.paused = True      # also registers it in application.sequences
         self.loop = False
         self.auto_destroy = True
 
@@ -47,12 +44,26 @@ class Sequence():
             setattr(self, key, value)
 
         self.generate()
-        application.sequences.append(self)
 
 
 
+    @property
+    def paused(self):
+        return self._paused
+
+    @paused.setter
+    def paused(self, value):
+        # keeps application.sequences' active/paused buckets in sync
+        self._paused = value
+        if value:
+            application.sequences.deactivate(self)
+        else:
+            application.sequences.activate(self)
+
+
     def generate(self):
         self.funcs = list()
+        self._cursor = 0
 
         for arg in self.args:
             if isinstance(arg, Wait):
@@ -83,13 +94,18 @@ class Sequence():
             f.finished = False
 
         self.t = 0
+        self._cursor = 0
         self.paused = False
+        if wake_loop:
+            wake_loop()
 
     def pause(self):
         self.paused = True
 
     def resume(self):
         self.paused = False
+        if wake_loop:
+            wake_loop()
 
     def finish(self):
         self.t = self.duration
@@ -97,9 +113,8 @@ class Sequence():
         self.update()
 
     def kill(self):
-        if self.auto_destroy and self in application.sequences:
+        if self.auto_destroy:
             application.sequences.remove(self)
-            del self
 
     @property
     def finished(self):
@@ -111,12 +126,16 @@ class Sequence():
             return
 
         if self.time_step is None:
-            self.t += time.dt * application.time_scale
+            self.t += time.dt   # already scaled by the main loop
         else:
             self.t += self.time_step * application.time_scale
 
-        for f in self.funcs:
-            if not f.finished and f.delay <= self.t:
+        # only look at the funcs that are due, not the whole list
+        funcs = self.funcs
+        while self._cursor < len(funcs) and funcs[self._cursor].delay <= self.t:
+            f = funcs[self._cursor]
+            self._cursor += 1
+            if not f.finished:
                 f()
 
 
@@ -126,11 +145,13 @@ class Sequence():
                     f.finished = False
 
                 self.t = 0
+                self._cursor = 0
                 return
 
-            if self.auto_destroy and self in application.sequences:
+            if self.auto_destroy:
                 application.sequences.remove(self)
-                del self
+            else:
+                application.sequences.deactivate(self)  # done, no need to update it every frame
 
 
 
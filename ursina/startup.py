@@ -0,0 +1,129 @@
+# Timestamps of the boot phases, from script load to the first frame the
+# player can interact with, to see where cold start time goes on phones.
+# Times are ms since the page started loading (performance.now()).
+#
+#   from ursina.startup import timeline
+#   with timeline.phase('build menu'):
+#       ...
+#   timeline.phases     # [dict(name, start, end, ms, depth), ...]
+#
+# Once the first animation frame has run the timeline is printed (with
+# application.print_startup_timeline) and kept in localStorage['ursina_startup'],
+# one JSON line per load for the last `keep` loads, for collecting from real
+# devices.
+import sys
+import time
+
+from ursina import application
+
+try:
+    from browser import window as _window
+except Exception:
+    _window = None
+
+
+def _to_json(value):
+    # the json module would add re and friends to the stdlib bundle
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(_to_json(v) for v in value) + ']'
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{_to_json(str(k))}: {_to_json(v)}' for k, v in value.items()) + '}'
+    return repr(round(value, 3) if isinstance(value, float) else value)
+
+
+class _Phase:
+    def __init__(self, timeline, name):
+        self.timeline = timeline
+        self.name = name
+
+    def __enter__(self):
+        self.timeline.begin(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.timeline.end(self.name)
+        return False
+
+
+class Timeline:
+    storage_key = 'ursina_startup'
+    keep = 20
+
+    def __init__(self):
+        self.phases = list()
+        self.finished = False
+        self._open = list()
+        # Brython's perf_counter() only has ms resolution. Under CPython use it
+        # anyway (from here on), the headless stand-in's performance.now() is a
+        # virtual clock.
+        self._origin = time.perf_counter()
+        self._performance = None
+        if sys.implementation.name == 'brython' and _window is not None:
+            self._performance = _window.performance
+
+        # set by index.html right before brython()
+        try:
+            for entry in _window.performance.getEntriesByName('brython start'):
+                self.phases.append(dict(name='brython start', start=entry.startTime, end=entry.startTime, ms=0, depth=0))
+        except Exception:
+            pass
+
+
+    def now(self):
+        if self._performance is not None:
+            return self._performance.now()
+        return (time.perf_counter() - self._origin) * 1000
+
+    def begin(self, name):
+        phase = dict(name=name, start=self.now(), end=None, ms=None, depth=len(self._open))
+        self.phases.append(phase)
+        self._open.append(phase)
+
+    def end(self, name):
+        phase = self._open.pop()
+        assert phase['name'] == name, f'ended {name!r} inside {phase["name"]!r}'
+        phase['end'] = self.now()
+        phase['ms'] = phase['end'] - phase['start']
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def mark(self, name):
+        t = self.now()
+        self.phases.append(dict(name=name, start=t, end=t, ms=0, depth=len(self._open)))
+
+
+    def finish(self, name='first frame'):
+        """Mark the boot as done and dump the timeline. Only the first call counts."""
+        if self.finished:
+            return
+        self.mark(name)
+        self.finished = True
+        self.dump()
+
+    def report(self):
+        lines = ['   start       ms  phase']
+        for p in self.phases:
+            ms = f'{p["ms"]:8.1f}' if p['ms'] else '        '
+            lines.append(f'{p["start"]:8.1f} {ms}  {"  " * p["depth"]}{p["name"]}')
+        return '\n'.join(lines)
+
+    def dump(self):
+        if application.print_startup_timeline:
+            print('startup timeline (ms since page load)\n' + self.report())
+        try:
+            storage = _window.localStorage
+            runs = (storage.getItem(self.storage_key) or '').splitlines()
+            runs.append(_to_json(dict(at=time.time(), phases=self.phases)))
+            storage.setItem(self.storage_key, '\n'.join(runs[-self.keep:]))
+        except Exception:
+            pass
+
+
+timeline = Timeline()
@@ -1,7 +1,10 @@
-from ursina import *
+from ursina import color
+from ursina.entity import Entity
+from ursina.main import camera, mouse
 
 
 class Text(Entity):
+    css_class = 'entity text'
 
     size = .025
     default_font = 'OpenSans-Regular.ttf'
@@ -16,10 +19,6 @@ class Text(Entity):
         self.parent = camera.ui
         self.background_color = color.clear
         self.color = color.smoke
-        self.b.style.whiteSpace = 'pre'
-        self.b.style.overflow = 'visible'
-        self.b.style.verticalAlign = 'text-top'
-        self.b.style.pointerEvents = 'none'
         self.origin = (0,0)
         self._background = None
         self.text = text
@@ -33,12 +32,12 @@ class Text(Entity):
 
     def __setattr__(self, name, value):
         if name == 'text':                  self.b.innerHTML = value
-        elif name == 'color':               self.b.style.color = value
-        elif name == 'background_color':    self.b.style.backgroundColor = value
-        elif name == 'scale':               self.b.style.fontSize = f'{50*value}px'
+        elif name == 'color':               self._set_style('color', value)
+        elif name == 'background_color':    self._set_style('background-color', value)
+        elif name == 'scale':               self._set_style('font-size', f'{50*value}px')
         elif name == 'origin':
-            self.b.style.textAlign = ('left', 'center', 'right')[int((value[0]*2)+1)]
-            self.b.style.direction = ('ltr', 'rtl', 'rtl')[int((value[0]*2)+1)]
+            self._set_style('text-align', ('left', 'center', 'right')[int((value[0]*2)+1)])
+            self._set_style('direction', ('ltr', 'rtl', 'rtl')[int((value[0]*2)+1)])
             #
             # self.b.style.textAlign = ('text-top', 'middle', 'text-bot')[int((value[0]*2)+1)]
             # self.b.style.transformOrigin = f'{value} {}'
@@ -72,6 +71,7 @@ class Text(Entity):
         if value == True:
             self.create_background()
         elif self._background:
+            from ursina import destroy
             destroy(self._background)
 
 
@@ -80,6 +80,7 @@ class Tooltip(Text):
     def __init__(self, text='', **kwargs):
         super().__init__(text, **kwargs)
         self.name = 'tooltip'
+        self.animated = True    # follows the mouse every frame
         self.background = Entity(parent=self, model='quad')
         # self.create_background()
 